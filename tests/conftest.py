@@ -65,3 +65,11 @@ def repository_with_data(
     for transaction in sample_transactions:
         repo._add_transaction(transaction)
     return repo
+
+
+@pytest.fixture
+def loaded_repo(sample_transactions: list[Transaction]) -> TransactionRepository:
+    """Create a repository bulk-loaded with the sample transactions."""
+    repo = TransactionRepository()
+    repo._add_transactions_bulk(sample_transactions)
+    return repo
@@ -217,6 +217,19 @@ class TestStatisticsRoutes:
         assert "total_transactions" in data or "total_amount" in data
 
 
+class TestDashboardRoutes:
+    """Test dashboard routes."""
+
+    def test_dashboard_combines_aggregates(self, client):
+        """Test that the dashboard matches the individual endpoints."""
+        response = client.get("/api/dashboard")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["overview"] == client.get("/api/stats/overview").json()
+        assert data["daily_stats"] == client.get("/api/stats/daily").json()
+        assert data["fraud_summary"] == client.get("/api/fraud/summary").json()
+
+
 class TestSystemRoutes:
     """Test system routes."""
 
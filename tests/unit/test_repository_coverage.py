@@ -1,6 +1,10 @@
 """Unit tests to improve repository coverage."""
 
+from dataclasses import replace
+from datetime import datetime
+
 import pytest
+from transaction_api.models import SearchFilters
 from transaction_api.repository import TransactionRepository
 
 @pytest.fixture(scope="module")
@@ -42,8 +46,6 @@ class TestRepositoryExtended:
 
     def test_search(self, repository):
         """Test searching transactions."""
-        from transaction_api.models import SearchFilters
-
         filters = SearchFilters(min_amount=100, max_amount=500)
         result, total = repository.search(filters)
         assert isinstance(result, list)
@@ -51,16 +53,12 @@ class TestRepositoryExtended:
 
     def test_search_by_use_chip(self, repository):
         """Test searching by use_chip."""
-        from transaction_api.models import SearchFilters
-
         filters = SearchFilters(use_chip="Swipe Transaction")
         result, total = repository.search(filters)
         assert isinstance(result, list)
 
     def test_search_by_merchant_city(self, repository):
         """Test searching by merchant city."""
-        from transaction_api.models import SearchFilters
-
         filters = SearchFilters(merchant_city="Beulah")
         result, total = repository.search(filters)
         assert isinstance(result, list)
@@ -116,3 +114,429 @@ class TestRepositoryExtended:
             repository.delete(transaction_id)
             new_count = len(repository.get_all_transactions())
             assert new_count == initial_count - 1
+
+    def test_get_all_pages_follow_date_order(self, repository):
+        """Test that consecutive pages match a full sort by date."""
+        expected = sorted(
+            repository.get_all_transactions(),
+            key=lambda t: t.date,
+            reverse=True,
+        )
+        first_page, total = repository.get_all(page=1, limit=20)
+        second_page, _ = repository.get_all(page=2, limit=20)
+        assert total == len(expected)
+        assert [t.id for t in first_page + second_page] == [
+            t.id for t in expected[:40]
+        ]
+
+    def test_search_unknown_use_chip_matches_nothing(self, repository):
+        """Test that an unseen categorical value returns no result."""
+        filters = SearchFilters(use_chip="Unknown Transaction")
+        result, total = repository.search(filters)
+        assert result == []
+        assert total == 0
+
+    def test_search_combined_filters_match_all_conditions(self, repository):
+        """Test that combined filters return only rows matching every filter."""
+        filters = SearchFilters(
+            client_id="1556",
+            use_chip="Swipe Transaction",
+            min_amount=100,
+            max_amount=2000,
+        )
+        result, total = repository.search(filters, page=1, limit=1000)
+        expected = [
+            t
+            for t in repository.get_all_transactions()
+            if t.client_id == "1556"
+            and t.use_chip == "Swipe Transaction"
+            and 100 <= t.amount <= 2000
+        ]
+        assert total == len(expected)
+        assert {t.id for t in result} == {t.id for t in expected}
+
+    def test_search_amount_bounds_are_inclusive(self, repository):
+        """Test that amount range bounds found by binary search are inclusive."""
+        amount = repository.get_all_transactions()[0].amount
+        filters = SearchFilters(min_amount=amount, max_amount=amount)
+        result, total = repository.search(filters, page=1, limit=1000)
+        assert total >= 1
+        assert all(t.amount == amount for t in result)
+
+        filters = SearchFilters(min_amount=amount + 1, max_amount=amount)
+        assert repository.search(filters) == ([], 0)
+
+
+def test_bulk_insert_matches_single_inserts(sample_transactions):
+    """Test that bulk insertion builds the same indexes as single inserts."""
+    single = TransactionRepository()
+    for transaction in sample_transactions:
+        single._add_transaction(transaction)
+    bulk = TransactionRepository()
+    bulk._add_transactions_bulk(sample_transactions)
+
+    assert bulk.transactions == single.transactions
+    assert bulk.get_all_customers() == single.get_all_customers()
+    assert bulk.get_by_merchant("M001") == single.get_by_merchant("M001")
+    assert bulk.type_index == single.type_index
+    assert bulk.use_chip_index == single.use_chip_index
+    assert bulk.date_index == single.date_index
+    assert bulk.fraud_index == single.fraud_index
+    assert (bulk.min_date, bulk.max_date) == (single.min_date, single.max_date)
+
+
+def test_readding_id_replaces_index_entries(loaded_repo, sample_transactions):
+    """Test that re-adding an ID leaves no stale entries in the indexes."""
+    moved = replace(sample_transactions[2], client_id="C003", errors=None)
+    loaded_repo._add_transactions_bulk([moved])
+
+    assert loaded_repo.get_by_customer("C002") == ([], 0)
+    assert loaded_repo.get_by_customer("C003")[1] == 1
+    assert loaded_repo.get_fraud_transactions() == []
+    assert len(loaded_repo.date_index) == len(sample_transactions)
+
+    loaded_repo.delete(moved.id)
+    assert loaded_repo.get_by_customer("C003") == ([], 0)
+
+
+def test_customer_view_is_refreshed_after_changes(loaded_repo, sample_transactions):
+    """Test that memoized customer pages follow inserts and deletes."""
+    first, total = loaded_repo.get_by_customer("C001", page=1, limit=1)
+    assert total == 2
+    assert first[0].id == "2"
+
+    newer = replace(sample_transactions[0], id="4", date=datetime(2023, 2, 1))
+    loaded_repo._add_transaction(newer)
+    assert loaded_repo.get_by_customer("C001", page=1, limit=1) == ([newer], 3)
+
+    loaded_repo.delete("4")
+    loaded_repo.delete("2")
+    assert loaded_repo.get_by_customer("C001") == ([sample_transactions[0]], 1)
+
+
+def test_parallel_load_matches_sequential_load(tmp_path):
+    """Test that byte-range parallel loading gives the same repository."""
+    lines = ["id,date,client_id,card_id,amount,use_chip,merchant_id,"
+             "merchant_city,merchant_state,zip,mcc,errors"]
+    for i in range(40):
+        lines.append(
+            f"{i},2023-01-{i % 28 + 1:02d} 10:00:00,C{i % 3},K{i},${i}.50,"
+            f"Swipe Transaction,M{i % 5},Boston,MA,02101,5411,"
+        )
+    lines[10] = "9,not a date,C0,K9,$1.00,Swipe Transaction,M0,Boston,MA,,5411,"
+    lines[20] = "19,2023-01-01 10:00:00,C0,K19,$abc,Swipe Transaction,M0,,,,,"
+    path = tmp_path / "transactions.csv"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    sequential = TransactionRepository()
+    counts = sequential._load_sequential(str(path))
+    parallel = TransactionRepository()
+    assert parallel._load_parallel(str(path), 3) == counts == (38, 2)
+    assert list(parallel.transactions) == list(sequential.transactions)
+    assert parallel.get_all_customers() == sequential.get_all_customers()
+    assert parallel.get_by_customer("C1") == sequential.get_by_customer("C1")
+
+
+def test_parallel_load_skips_utf8_bom(tmp_path):
+    """Test that a BOM before the header loads the same rows on both paths."""
+    lines = ["id,date,client_id,card_id,amount,use_chip,merchant_id,"
+             "merchant_city,merchant_state,zip,mcc,errors"]
+    for i in range(10):
+        lines.append(
+            f"{i},2023-01-{i + 1:02d} 10:00:00,C{i % 3},K{i},${i}.50,"
+            f"Swipe Transaction,M{i % 5},Boston,MA,02101,5411,"
+        )
+    path = tmp_path / "transactions.csv"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8-sig")
+
+    sequential = TransactionRepository()
+    parallel = TransactionRepository()
+    assert parallel._load_parallel(str(path), 2) == (10, 0)
+    assert sequential._load_sequential(str(path)) == (10, 0)
+    assert list(parallel.transactions) == list(sequential.transactions)
+
+
+def test_load_strips_fields_and_rejects_empty_amounts(tmp_path):
+    """Test padded fields, blank ids and empty amounts as the row parser did."""
+    path = tmp_path / "transactions.csv"
+    path.write_text(
+        "id,date,client_id,card_id,amount,use_chip,merchant_id,"
+        "merchant_city,merchant_state,zip,mcc,errors\n"
+        " 1 , 2023-01-01 10:00:00 , C1 ,K1, $10.00 , Swipe Transaction ,"
+        " M1 , ONLINE , MA ,02101, 5411 , Bad PIN \n"
+        "  ,2023-01-02 10:00:00,C2,K2,$5.00,Chip Transaction,M2,,,,5411,\n"
+        "3,2023-01-03 10:00:00,C3,K3,,Chip Transaction,M3,,,,5411,\n"
+        "4,2023-01-04 10:00:00,C4,K4,$,Chip Transaction,M4,,,,5411,  \n",
+        encoding="utf-8",
+    )
+
+    repo = TransactionRepository()
+    assert repo._load_sequential(str(path)) == (1, 2)
+    assert list(repo.transactions) == ["1"]
+    transaction = repo.get_by_id("1")
+    assert transaction.amount == 10.0
+    assert transaction.client_id == "C1"
+    assert transaction.use_chip == "Swipe Transaction"
+    assert transaction.merchant_city == "ONLINE"
+    assert transaction.errors == "Bad PIN"
+
+
+def test_search_by_transaction_id_combines_with_other_filters(
+    loaded_repo, sample_transactions
+):
+    """Test that the direct ID lookup still applies the other filters."""
+    filters = SearchFilters(transaction_id="3", min_amount=100)
+    assert loaded_repo.search(filters) == ([sample_transactions[2]], 1)
+    filters = SearchFilters(transaction_id="3", client_id="C001")
+    assert loaded_repo.search(filters) == ([], 0)
+    filters = SearchFilters(transaction_id="3", max_amount=120)
+    assert loaded_repo.search(filters) == ([], 0)
+    assert loaded_repo.search(SearchFilters(transaction_id="404")) == ([], 0)
+
+
+def test_column_store_follows_deletes_and_replacements(sample_transactions):
+    """Test that the column store stays aligned after swap removals."""
+    repo = TransactionRepository()
+    for transaction in sample_transactions:
+        repo._add_transaction(transaction)
+    repo.delete("1")
+    repo._add_transaction(replace(sample_transactions[1], amount=999.0))
+
+    columns = repo._get_columns()
+    assert sorted(columns["id"].tolist()) == ["2", "3"]
+    for tid, row in repo._row_index.items():
+        assert columns["transaction"][row] is repo.transactions[tid]
+        assert columns["amount"][row] == repo.transactions[tid].amount
+
+    result, total = repo.get_all()
+    assert [t.id for t in result] == ["3", "2"]
+    assert repo.search(SearchFilters(min_amount=500)) == ([repo.get_by_id("2")], 1)
+
+
+def test_maintained_date_order_matches_full_sort(loaded_repo, sample_transactions):
+    """Test that the merged date order equals a fresh sort after changes."""
+    loaded_repo.get_all()
+    for i in range(20):
+        day = datetime(2023, 1, i % 4 + 1, 12, 0, 0)
+        moved = replace(sample_transactions[0], id=f"N{i}", date=day)
+        loaded_repo._add_transaction(moved)
+        if i % 3 == 0:
+            loaded_repo.delete(f"N{i // 2}")
+
+    expected = sorted(
+        loaded_repo.get_all_transactions(), key=lambda t: t.date, reverse=True
+    )
+    fresh = TransactionRepository()
+    fresh._add_transactions_bulk(list(loaded_repo.transactions.values()))
+    assert loaded_repo.get_all(page=1, limit=1000)[0] == fresh.get_all(1, 1000)[0]
+    assert [t.date for t in loaded_repo.get_all(page=1, limit=1000)[0]] == [
+        t.date for t in expected
+    ]
+
+
+def test_date_bounds_follow_deletes(sample_transactions):
+    """Test that min/max dates are recomputed after deletions."""
+    repo = TransactionRepository()
+    assert repo.min_date is None and repo.max_date is None
+    repo._add_transactions_bulk(sample_transactions)
+    assert repo.min_date == datetime(2023, 1, 1, 12, 0, 0)
+    assert repo.max_date == datetime(2023, 1, 3, 12, 0, 0)
+
+    repo.get_all()
+    repo.delete("3")
+    assert repo.max_date == datetime(2023, 1, 2, 12, 0, 0)
+    repo.delete("1")
+    assert repo.min_date == datetime(2023, 1, 2, 12, 0, 0)
+
+
+def test_top_customers_match_full_sort(repository):
+    """Test that partial top-n selection equals a full sort of the counts."""
+    from collections import Counter
+
+    counts = Counter(t.client_id for t in repository.get_all_transactions())
+    expected = sorted(
+        counts.items(),
+        key=lambda item: (-item[1], repository.get_all_customers().index(item[0])),
+    )[:5]
+    top = repository.get_top_customers(5)
+    assert [(cid, count) for cid, count, _ in top] == expected
+    for cid, _, total in top:
+        assert total == pytest.approx(
+            sum(t.amount for t in repository.get_by_customer(cid, 1, 1000)[0])
+        )
+    assert repository.get_top_customers(0) == []
+
+
+def test_customer_totals_follow_deletes(loaded_repo, sample_transactions):
+    """Test per-customer count and amount lookups before and after a delete."""
+    expected = sum(t.amount for t in sample_transactions if t.client_id == "C001")
+    assert loaded_repo.count_by_customer("C001") == 2
+    assert loaded_repo.sum_amount_by_customer("C001") == pytest.approx(expected)
+    assert loaded_repo.count_by_customer("unknown") == 0
+    assert loaded_repo.sum_amount_by_customer("unknown") == 0.0
+
+    loaded_repo.delete("1")
+    assert loaded_repo.count_by_customer("C001") == 1
+
+
+def test_sorted_customer_ids(repository):
+    """Test that the memoized customer order matches a full sort."""
+    assert repository.sorted_customer_ids.tolist() == sorted(
+        repository.get_all_customers()
+    )
+    assert repository.sorted_customer_ids is repository.sorted_customer_ids
+
+
+def test_counts_by_customers_batch(repository):
+    """Test that batched customer counts equal the single lookups."""
+    customer_ids = repository.get_all_customers()[:20] + ["unknown"]
+    counts = repository.get_counts_by_customers(customer_ids)
+    assert counts == {cid: repository.count_by_customer(cid) for cid in customer_ids}
+    assert counts["unknown"] == 0
+    assert repository.get_counts_by_customers([]) == {}
+
+
+def test_use_chip_counts_follow_deletes(loaded_repo):
+    """Test that per-type counts are read from the maintained index."""
+    assert loaded_repo.get_use_chip_counts() == {
+        "Chip Transaction": 2,
+        "Swipe Transaction": 1,
+    }
+
+    loaded_repo.delete("3")
+    assert loaded_repo.get_use_chip_counts()["Swipe Transaction"] == 0
+
+
+def test_fraud_amount_is_maintained(loaded_repo):
+    """Test the running fraud amount across inserts and deletes."""
+    assert loaded_repo.fraud_amount == pytest.approx(
+        sum(t.amount for t in loaded_repo.get_fraud_transactions())
+    )
+
+    loaded_repo.delete("3")
+    assert loaded_repo.fraud_amount == 0.0
+
+
+def test_fraud_counts_by_use_chip(repository):
+    """Test the single-pass fraud counts against a per-type filter."""
+    counts = repository.get_fraud_counts_by_use_chip()
+    for use_chip in repository.get_all_use_chip_types():
+        expected = sum(
+            1 for t in repository.get_all_by_use_chip(use_chip) if t.errors
+        )
+        assert counts.get(use_chip, 0) == expected
+
+
+def test_daily_totals_match_python_grouping(repository):
+    """Test the vectorized daily totals against a per-transaction grouping."""
+    from collections import defaultdict
+
+    expected = defaultdict(lambda: [0, 0.0])
+    for transaction in repository.get_all_transactions():
+        day = expected[str(transaction.date.date())]
+        day[0] += 1
+        day[1] += transaction.amount
+
+    totals = repository.get_daily_totals()
+    assert [day for day, _, _ in totals] == sorted(expected)
+    for day, count, total_amount in totals:
+        assert count == expected[day][0]
+        assert total_amount == pytest.approx(expected[day][1])
+
+
+def test_column_views_are_read_only(loaded_repo):
+    """Test the count and column views against the stored transactions."""
+    loaded_repo.delete("1")
+    transactions = loaded_repo.get_all_transactions()
+
+    assert loaded_repo.count() == len(transactions)
+    dates = sorted(t.date for t in transactions)
+    assert sorted(loaded_repo.dates_view().tolist()) == dates
+    assert loaded_repo.fraud_view().sum() == len(loaded_repo.fraud_index)
+    views = (
+        loaded_repo.amounts_view(),
+        loaded_repo.dates_view(),
+        loaded_repo.fraud_view(),
+    )
+    for view in views:
+        assert not view.flags.writeable
+
+
+def test_totals_by_type_are_sorted_by_count(repository):
+    """Test that type totals come sorted by count descending."""
+    counts = [count for _, count, _ in repository.get_totals_by_type()]
+    assert counts == sorted(counts, reverse=True)
+    assert sum(counts) == repository.count()
+
+
+def test_delete_reports_whether_a_transaction_was_removed(
+    loaded_repo, sample_transactions
+):
+    """Test the return value of delete."""
+    assert loaded_repo.delete("1") is True
+    assert loaded_repo.delete("1") is False
+    assert loaded_repo.count() == len(sample_transactions) - 1
+
+
+def test_total_amount_is_maintained(loaded_repo, sample_transactions):
+    """Test the running total amount across inserts and deletes."""
+    loaded_repo._add_transaction(replace(sample_transactions[0], id="4", amount=12.5))
+    assert loaded_repo.total_amount == pytest.approx(loaded_repo.amounts_view().sum())
+
+    for transaction in loaded_repo.get_all_transactions():
+        loaded_repo.delete(transaction.id)
+    assert loaded_repo.total_amount == 0.0
+
+
+def test_reads_in_threads_stay_consistent_during_deletes(sample_transactions):
+    """Test that reader threads never see a half-removed row."""
+    import threading
+
+    repo = TransactionRepository()
+    repo._add_transactions_bulk(
+        [
+            replace(
+                sample_transactions[i % 3],
+                id=str(i),
+                date=datetime(2023, 1, i % 28 + 1),
+                client_id=f"C{i % 7}",
+            )
+            for i in range(3000)
+        ]
+    )
+    done = threading.Event()
+    failures = []
+
+    def read(query):
+        while not done.is_set():
+            try:
+                page = query()
+                ids = [t.id for t in page]
+                assert len(set(ids)) == len(ids)
+            except Exception as exc:
+                failures.append(exc)
+                return
+
+    def customer_page():
+        page, _ = repo.get_by_customer("C3", page=1, limit=100)
+        assert all(t.client_id == "C3" for t in page)
+        return page
+
+    readers = [
+        threading.Thread(target=read, args=(query,))
+        for query in (
+            lambda: repo.get_all(page=1, limit=500)[0],
+            lambda: repo.search(SearchFilters(min_amount=0), 1, 500)[0],
+            customer_page,
+        )
+    ]
+    for reader in readers:
+        reader.start()
+    for i in range(3000):
+        repo.delete(str(i))
+    done.set()
+    for reader in readers:
+        reader.join()
+
+    assert failures == []
+    assert repo.count() == 0
@@ -41,10 +41,38 @@ class TestCustomerRoutesExtended:
         data = response.json()
         assert len(data) <= 5
 
+    def test_cursor_pages_match_offset_pages(self, client):
+        """Test that walking next_cursor yields the same pages as page numbers."""
+        first = client.get("/api/customers?limit=5").json()
+        cursor = first["pagination"]["next_cursor"]
+        assert cursor == first["data"][-1]["customer_id"]
+
+        by_cursor = client.get(f"/api/customers?limit=5&cursor={cursor}").json()
+        by_page = client.get("/api/customers?page=2&limit=5").json()
+        assert by_cursor["data"] == by_page["data"]
+        assert by_cursor["pagination"]["page"] == 2
+
+    def test_top_customers_etag_returns_not_modified(self, client):
+        """Test that customer listings honour If-None-Match."""
+        etag = client.get("/api/customers/Ranked/top?n=5").headers["ETag"]
+        response = client.get(
+            "/api/customers/Ranked/top?n=5", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+
 
 class TestTransactionRoutesExtended:
     """Extended tests for transaction routes."""
 
+    def test_large_listing_is_gzip_compressed(self, client):
+        """Test that large listings are compressed when the client accepts gzip."""
+        response = client.get(
+            "/api/transaction?limit=100", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()["data"]) == 100
+
     def test_get_transaction_by_id_success(self, client):
         """Test getting transaction by ID."""
         response = client.get("/api/transaction?page=1&limit=1")
@@ -55,6 +83,14 @@ class TestTransactionRoutesExtended:
             response = client.get(f"/api/transaction/{transaction_id}")
             assert response.status_code == 200
 
+    def test_missing_transaction_uses_global_handler(self, client):
+        """Test that domain errors are mapped by the application handlers."""
+        response = client.get("/api/transaction/does-not-exist")
+        assert response.status_code == 404
+        assert response.json()["error"] == "Transaction not found"
+        response = client.delete("/api/transaction/does-not-exist")
+        assert response.status_code == 404
+
     def test_search_transactions_with_multiple_filters(self, client):
         """Test searching transactions with multiple filters."""
         response = client.post(
@@ -98,6 +134,31 @@ class TestFraudRoutesExtended:
                 )
                 assert response.status_code == 200
 
+    def test_predict_fraud_batch(self, client):
+        """Test that the batch endpoint returns one prediction per item."""
+        data = client.get("/api/transaction?page=1&limit=3").json()["data"]
+        response = client.post("/api/fraud/predict/batch", json=data)
+        assert response.status_code == 200
+        assert response.json() == [
+            client.post("/api/fraud/predict", json=t).json() for t in data
+        ]
+        assert client.post("/api/fraud/predict/batch", json=[]).status_code == 422
+
+    def test_service_is_reused_until_repository_changes(self):
+        """Test that the cached service follows the current repository."""
+        from transaction_api.routes import fraud_routes
+
+        service = fraud_routes.get_service()
+        assert fraud_routes.get_service() is service
+        assert service.repository is app_context.repository
+
+        previous = app_context.repository
+        app_context.repository = TransactionRepository()
+        try:
+            assert fraud_routes.get_service().repository is app_context.repository
+        finally:
+            app_context.repository = previous
+
 
 class TestStatisticsRoutesExtended:
     """Extended tests for statistics routes."""
@@ -107,6 +168,54 @@ class TestStatisticsRoutesExtended:
         response = client.get("/api/stats/overview")
         assert response.status_code == 200
 
+    def test_cached_overview_follows_deletes(self, client, loaded_repo):
+        """Test that cached statistics are recomputed after a deletion."""
+        previous = app_context.repository
+        app_context.repository = loaded_repo
+        try:
+            first = client.get("/api/stats/overview").json()
+            assert client.get("/api/stats/overview").json() == first
+            assert client.delete("/api/transaction/3").status_code == 204
+            second = client.get("/api/stats/overview").json()
+            assert second["total_count"] == first["total_count"] - 1
+        finally:
+            app_context.repository = previous
+
+    def test_daily_stats_column_layout(self, client):
+        """Test that the column layout transposes the daily records."""
+        records = client.get("/api/stats/daily").json()
+        columns = client.get("/api/stats/daily?format=columns").json()
+        assert list(columns) == ["date", "count", "total_amount", "average_amount"]
+        assert columns["date"] == [row["date"] for row in records]
+        assert columns["count"] == [row["count"] for row in records]
+        assert client.get("/api/stats/by-type?format=arrow").status_code == 422
+
+    def test_daily_stats_ndjson_stream(self, client):
+        """Test that the NDJSON stream yields one record per line."""
+        import json
+
+        records = client.get("/api/stats/daily").json()
+        for _ in range(2):
+            response = client.get("/api/stats/daily?format=ndjson")
+            assert response.headers["content-type"] == "application/x-ndjson"
+            lines = response.text.splitlines()
+            assert [json.loads(line) for line in lines] == records
+
+    def test_overview_etag_returns_not_modified(self, client, loaded_repo):
+        """Test that a matching ETag short-circuits until the data changes."""
+        previous = app_context.repository
+        app_context.repository = loaded_repo
+        try:
+            etag = client.get("/api/stats/overview").headers["ETag"]
+            headers = {"If-None-Match": etag}
+            assert client.get("/api/stats/overview", headers=headers).status_code == 304
+            loaded_repo.delete("3")
+            response = client.get("/api/stats/overview", headers=headers)
+            assert response.status_code == 200
+            assert response.headers["ETag"] != etag
+        finally:
+            app_context.repository = previous
+
     def test_get_amount_distribution(self, client):
         """Test getting amount distribution."""
         response = client.get("/api/stats/amount-distribution")
@@ -1,5 +1,7 @@
 """Unit tests to improve service coverage."""
 
+from dataclasses import replace
+
 import pytest
 from transaction_api.repository import TransactionRepository
 from transaction_api.services.customer_service import CustomerService
@@ -39,6 +41,41 @@ class TestCustomerServiceExtended:
         result = service.get_top_customers(n=5)
         assert len(result) <= 5
 
+    def test_customer_results_are_refreshed_after_changes(self, loaded_repo):
+        """Test that cached customer results follow deletes."""
+        service = CustomerService(loaded_repo)
+        page = service.get_all_customers(page=1, limit=10)
+        assert service.get_all_customers(page=1, limit=10) is page
+        assert service.get_top_customers(n=1)[0].transaction_count == 2
+
+        loaded_repo.delete("1")
+        counts = {
+            c.customer_id: c.transaction_count
+            for c in service.get_all_customers(page=1, limit=10).data
+        }
+        assert counts == {"C001": 1, "C002": 1}
+        assert service.get_top_customers(n=1)[0].transaction_count == 1
+
+    def test_service_cache_is_bounded(self, repository):
+        """Test that the shared service cache evicts its oldest entries."""
+        from transaction_api.config import CACHE_MAX_ENTRIES
+
+        service = CustomerService(repository)
+        for n in range(1, CACHE_MAX_ENTRIES + 3):
+            service.get_top_customers(n=n)
+        assert len(service._cache._entries) == CACHE_MAX_ENTRIES
+
+    def test_customer_counts_are_not_truncated(self, sample_transactions):
+        """Test that customers with over a page of transactions are fully counted."""
+        repo = TransactionRepository()
+        repo._add_transactions_bulk(
+            [replace(sample_transactions[0], id=str(i)) for i in range(120)]
+        )
+        service = CustomerService(repo)
+        summary = service.get_all_customers(page=1, limit=10).data[0]
+        assert summary.transaction_count == 120
+        assert service.get_customer_details("C001").transaction_count == 120
+
 class TestFraudServiceExtended:
     """Extended tests for fraud service."""
 
@@ -67,6 +104,36 @@ class TestFraudServiceExtended:
             assert hasattr(result, "fraud_score")
             assert hasattr(result, "reasoning")
 
+    def test_fraud_aggregates_are_refreshed_after_changes(self, loaded_repo):
+        """Test that fraud aggregates follow deletes."""
+        service = FraudService(loaded_repo)
+        summary = service.get_fraud_summary()
+        assert summary.total_fraud_count == 1
+
+        loaded_repo.delete("3")
+        assert service.get_fraud_summary().total_fraud_count == 0
+        assert all(s.fraud_count == 0 for s in service.get_fraud_by_type())
+
+    def test_empty_repository_summary(self):
+        """Test the fraud summary of an empty repository."""
+        summary = FraudService(TransactionRepository()).get_fraud_summary()
+        assert summary.total_fraud_count == 0
+        assert summary.fraud_rate == 0.0
+        assert summary.total_fraud_amount == 0.0
+
+    def test_batch_prediction_matches_single_predictions(
+        self, sample_transactions
+    ):
+        """Test that vectorized batch scoring equals per-transaction scoring."""
+        service = FraudService(TransactionRepository())
+        transactions = list(sample_transactions) + [
+            replace(sample_transactions[0], id="4", amount=2500.0, use_chip=""),
+            replace(sample_transactions[2], id="5", amount=9000.0),
+            replace(sample_transactions[1], id="6", amount=5000.0),
+        ]
+        assert service.predict_fraud_batch(transactions) == [
+            service.predict_fraud(t) for t in transactions
+        ]
 
 class TestStatisticsServiceExtended:
     """Extended tests for statistics service."""
@@ -97,6 +164,58 @@ class TestStatisticsServiceExtended:
         result = service.get_daily_stats()
         assert isinstance(result, list)
 
+    def test_empty_repository_distribution(self):
+        """Test the amount distribution of an empty repository."""
+        service = StatisticsService(TransactionRepository())
+        buckets = service.get_amount_distribution().buckets
+        assert [b.count for b in buckets] == [0] * len(buckets)
+
+    def test_amount_buckets_match_range_checks(self, sample_transactions):
+        """Test vectorized bucketing on bucket bounds and out-of-range amounts."""
+        from transaction_api.config import AMOUNT_BUCKETS
+
+        amounts = [-5.0, 0.0, 99.99, 100.0, 500.0, 999.99, 1000.0, 1e9]
+        repo = TransactionRepository()
+        repo._add_transactions_bulk(
+            [
+                replace(sample_transactions[0], id=str(i), amount=amount)
+                for i, amount in enumerate(amounts)
+            ]
+        )
+        buckets = StatisticsService(repo).get_amount_distribution().buckets
+        expected = [
+            sum(1 for a in amounts if b["min"] <= a < b["max"])
+            for b in AMOUNT_BUCKETS
+        ]
+        assert [b.count for b in buckets] == expected
+        assert buckets[0].percentage == pytest.approx(200 / len(amounts))
+
+    def test_stats_by_type_match_transactions(self, repository):
+        """Test grouped type totals against a per-type recomputation."""
+        service = StatisticsService(repository)
+        for stats in service.get_stats_by_type()[:5]:
+            transactions = repository.get_all_by_type(stats.type)
+            assert stats.count == len(transactions)
+            assert stats.total_amount == pytest.approx(
+                sum(t.amount for t in transactions)
+            )
+
+    def test_statistics_are_refreshed_after_changes(self, loaded_repo):
+        """Test that statistics follow deletes."""
+        service = StatisticsService(loaded_repo)
+        overview = service.get_overview_stats()
+        daily_before = sum(day["count"] for day in service.get_daily_stats())
+
+        loaded_repo.delete("1")
+        assert service.get_overview_stats().total_count == overview.total_count - 1
+        assert sum(day["count"] for day in service.get_daily_stats()) == (
+            daily_before - 1
+        )
+        assert sum(t.count for t in service.get_stats_by_type()) == 2
+        assert sum(
+            b.count for b in service.get_amount_distribution().buckets
+        ) <= 2
+
 
 class TestHealthServiceExtended:
     """Extended tests for health service."""
@@ -107,6 +226,16 @@ class TestHealthServiceExtended:
         result = service.check_health()
         assert hasattr(result, "status")
 
+    def test_check_health_does_not_scan_transactions(self, repository):
+        """Test that the health probe only pings the repository."""
+        from unittest.mock import patch
+
+        service = HealthService(repository)
+        with patch.object(
+            repository, "get_all_transactions", side_effect=AssertionError
+        ):
+            assert service.check_health().status == "healthy"
+
     def test_get_metadata(self, repository):
         """Test getting metadata."""
         service = HealthService(repository)
@@ -114,6 +243,23 @@ class TestHealthServiceExtended:
         assert hasattr(result, "api_version")
         assert hasattr(result, "data_load_date")
 
+    def test_empty_repository_dates_use_load_date(self):
+        """Test that empty-repository dates fall back to the load date."""
+        repo = TransactionRepository()
+        metadata = HealthService(repo).get_metadata()
+        overview = StatisticsService(repo).get_overview_stats()
+        assert metadata.min_date == metadata.max_date == repo.data_load_date
+        assert overview.min_date == overview.max_date == repo.data_load_date
+
+    def test_metadata_date_bounds(self, repository):
+        """Test that metadata bounds match the transaction dates."""
+        metadata = HealthService(repository).get_metadata()
+        dates = [t.date for t in repository.get_all_transactions()]
+        assert metadata.min_date == min(dates)
+        assert metadata.max_date == max(dates)
+        assert metadata.total_transaction_count == len(dates)
+
+
 class TestTransactionServiceExtended:
     """Extended tests for transaction service."""
 
@@ -147,6 +293,16 @@ class TestTransactionServiceExtended:
         result = service.get_transaction_types()
         assert isinstance(result, list)
 
+    def test_transaction_types_are_refreshed_after_changes(self, loaded_repo):
+        """Test that cached type counts follow deletes."""
+        service = TransactionService(loaded_repo)
+        before = sum(t["count"] for t in service.get_transaction_types())
+        assert before == 3
+
+        loaded_repo.delete("1")
+        after = sum(t["count"] for t in service.get_transaction_types())
+        assert after == 2
+
     def test_get_recent_transactions(self, repository):
         """Test getting recent transactions."""
         service = TransactionService(repository)
@@ -23,6 +23,8 @@ logging_config
     Configuration de la journalisation et utilitaires.
 app_context
     Gestion du contexte global de l'application.
+cache
+    Cache en mémoire à durée de vie limitée pour les routes GET.
 routes
     Gestionnaires de routes API organisés par fonctionnalité.
 services
@@ -0,0 +1,255 @@
+"""Cache en mémoire à durée de vie limitée pour les routes de l'API.
+
+Ce module fournit un cache TTL pour les points de terminaison GET idempotents
+(agrégations de statistiques, de fraude et métadonnées). Une entrée est servie
+tant que sa durée de vie n'est pas écoulée et que les données du référentiel
+n'ont pas changé : toute insertion ou suppression incrémente
+``TransactionRepository.data_version`` et rend les entrées existantes périmées.
+
+Classes
+-------
+TTLCache
+    Cache clé -> valeur avec expiration et taille maximale.
+VersionedCache
+    Cache des résultats d'un service, valides pour une version des données.
+
+Fonctions
+---------
+ttl_cache(ttl_seconds)
+    Décorateur mettant en cache le résultat d'un point de terminaison asynchrone.
+"""
+
+import threading
+import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi.responses import Response, StreamingResponse
+
+from transaction_api import app_context
+from transaction_api.config import CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS
+from transaction_api.repository import TransactionRepository
+
+
+class TTLCache:
+    """Cache clé -> valeur avec expiration et taille maximale.
+
+    Chaque entrée mémorise son instant d'expiration et l'état des données
+    (référentiel et version) pour lequel elle a été calculée. Le cache n'est
+    utilisé que depuis la boucle d'événements, sans ``await`` entre la lecture
+    et l'écriture, et n'a donc pas besoin de verrou.
+
+    Attributs
+    ---------
+    ttl_seconds : float
+        Durée de vie des entrées en secondes.
+    maxsize : int
+        Nombre maximum d'entrées ; les plus anciennes sont évincées en premier.
+    """
+
+    def __init__(
+        self, ttl_seconds: float = CACHE_TTL_SECONDS, maxsize: int = CACHE_MAX_ENTRIES
+    ) -> None:
+        """Initialiser le cache.
+
+        Paramètres
+        ----------
+        ttl_seconds : float, optionnel
+            Durée de vie des entrées en secondes. Par défaut CACHE_TTL_SECONDS.
+        maxsize : int, optionnel
+            Nombre maximum d'entrées. Par défaut CACHE_MAX_ENTRIES.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Hashable, Any]] = {}
+
+    def get(self, key: Hashable, stamp: Hashable) -> Optional[Any]:
+        """Lire une entrée encore valide.
+
+        Paramètres
+        ----------
+        key : Hashable
+            Clé de l'entrée.
+        stamp : Hashable
+            État courant des données ; une entrée calculée pour un autre état
+            est considérée comme périmée.
+
+        Retours
+        -------
+        Any, optionnel
+            La valeur mise en cache, ou None si absente ou périmée.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, entry_stamp, value = entry
+        if entry_stamp != stamp or expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, stamp: Hashable, value: Any) -> None:
+        """Enregistrer une entrée.
+
+        Paramètres
+        ----------
+        key : Hashable
+            Clé de l'entrée.
+        stamp : Hashable
+            État des données pour lequel la valeur a été calculée.
+        value : Any
+            Valeur à mettre en cache.
+        """
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            # Dicts keep insertion order: the first key is the oldest entry
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, stamp, value)
+
+    def clear(self) -> None:
+        """Vider le cache."""
+        self._entries.clear()
+
+
+class VersionedCache:
+    """Cache des résultats d'un service, valides pour une version des données.
+
+    Une entrée est servie tant que ``data_version`` du référentiel n'a pas
+    changé depuis son calcul ; aucune durée de vie ne s'applique. Les services
+    sont appelés depuis des threads de travail : la table des entrées est
+    protégée par un verrou, pris en dehors du calcul des résultats.
+
+    Attributs
+    ---------
+    repository : TransactionRepository
+        Le référentiel dont la version des données date les entrées.
+    maxsize : int
+        Nombre maximum d'entrées ; les plus anciennes sont évincées en premier.
+    """
+
+    __slots__ = ("repository", "maxsize", "_entries", "_lock")
+
+    def __init__(
+        self, repository: TransactionRepository, maxsize: int = CACHE_MAX_ENTRIES
+    ) -> None:
+        """Initialiser le cache.
+
+        Paramètres
+        ----------
+        repository : TransactionRepository
+            Le référentiel dont la version des données date les entrées.
+        maxsize : int, optionnel
+            Nombre maximum d'entrées. Par défaut CACHE_MAX_ENTRIES.
+        """
+        self.repository = repository
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[int, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Lire une entrée, calculée à nouveau si les données ont changé.
+
+        Paramètres
+        ----------
+        key : Hashable
+            Nom du résultat et paramètres de l'appel.
+        compute : Callable[[], Any]
+            Fonction calculant le résultat lorsque l'entrée est absente ou
+            périmée.
+
+        Retours
+        -------
+        Any
+            Le résultat pour la version courante du référentiel.
+        """
+        version = self.repository.data_version
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            entry = (version, compute())
+            with self._lock:
+                self._entries.pop(key, None)
+                if len(self._entries) >= self.maxsize:
+                    # Dicts keep insertion order: the first key is the oldest
+                    del self._entries[next(iter(self._entries))]
+                self._entries[key] = entry
+        return entry[1]
+
+
+def _copy_response(response: Response) -> Response:
+    """Copier une réponse déjà rendue, avec son corps et ses en-têtes.
+
+    Paramètres
+    ----------
+    response : Response
+        La réponse mise en cache.
+
+    Retours
+    -------
+    Response
+        Une nouvelle réponse que les middlewares peuvent modifier.
+    """
+    copy = Response(content=response.body, status_code=response.status_code)
+    copy.raw_headers = list(response.raw_headers)
+    return copy
+
+
+def ttl_cache(
+    ttl_seconds: float = CACHE_TTL_SECONDS,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Mettre en cache le résultat d'un point de terminaison asynchrone.
+
+    La clé est formée du nom qualifié de la fonction et de ses paramètres
+    triés, de sorte que deux requêtes équivalentes partagent la même entrée.
+    La signature de la fonction est conservée pour l'injection de FastAPI.
+    Sans référentiel initialisé, le cache est contourné ; les réponses en
+    flux ne sont jamais mises en cache et les autres réponses sont copiées
+    à chaque envoi.
+
+    Paramètres
+    ----------
+    ttl_seconds : float, optionnel
+        Durée de vie des entrées en secondes. Par défaut CACHE_TTL_SECONDS.
+
+    Retours
+    -------
+    Callable
+        Décorateur à appliquer sous ``@router.get(...)``.
+
+    Exemples
+    --------
+    >>> @router.get("/summary")
+    ... @ttl_cache(60)
+    ... async def get_fraud_summary() -> FraudSummary:
+    ...     return get_service().get_fraud_summary()
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        cache = TTLCache(ttl_seconds)
+
+        @wraps(func)
+        async def wrapper(**kwargs: Any) -> Any:
+            repository = app_context.repository
+            if repository is None:
+                return await func(**kwargs)
+
+            key = (func.__qualname__, tuple(sorted(kwargs.items())))
+            stamp = (id(repository), repository.data_version)
+            value = cache.get(key, stamp)
+            if value is None:
+                value = await func(**kwargs)
+                # A streamed body can only be sent once
+                if isinstance(value, StreamingResponse):
+                    return value
+                cache.set(key, stamp, value)
+            if isinstance(value, Response):
+                # Middlewares (gzip, ETag) edit the headers of the response
+                # they send: never hand out the cached instance itself.
+                return _copy_response(value)
+            return value
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
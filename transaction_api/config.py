@@ -12,10 +12,18 @@ API_TITLE : str
     Le titre de l'API Transaction.
 API_DESCRIPTION : str
     Une brève description du but de l'API Transaction.
+API_WORKERS : int
+    Nombre de processus uvicorn (variable ``WEB_CONCURRENCY``). Chaque
+    processus charge sa propre copie des données : une suppression n'est
+    visible que dans le processus qui l'a traitée.
 CSV_FILE_PATH : str
     Chemin d'accès au fichier CSV contenant les données de transactions.
 CHUNK_SIZE : int
     Nombre de lignes à lire à la fois lors du traitement des données CSV.
+CSV_PARALLEL_MIN_BYTES : int
+    Taille de fichier CSV à partir de laquelle le chargement est parallélisé.
+CSV_WORKERS : int
+    Nombre de processus utilisés pour le chargement parallèle du CSV.
 DEFAULT_LIMIT : int
     Nombre par défaut d'éléments à retourner dans les réponses paginées.
 MAX_LIMIT : int
@@ -26,6 +34,18 @@ RESPONSE_TIME_THRESHOLD_MS : float
     Seuil en millisecondes pour les temps de réponse normaux.
 COMPLEX_QUERY_THRESHOLD_MS : float
     Seuil en millisecondes pour les temps de réponse des requêtes complexes.
+CACHE_TTL_SECONDS : float
+    Durée de vie en secondes des réponses mises en cache par les routes GET.
+CACHE_MAX_ENTRIES : int
+    Nombre maximum d'entrées conservées par chaque cache de route.
+ETAG_PATH_PREFIXES : tuple
+    Préfixes des chemins GET servis avec un ETag et des réponses 304
+    conditionnelles : agrégations, listes de clients, types et transactions
+    récentes, qui ne changent qu'avec les données.
+GZIP_MINIMUM_SIZE : int
+    Taille en octets à partir de laquelle les réponses sont compressées en gzip.
+GZIP_COMPRESS_LEVEL : int
+    Niveau de compression gzip (1 à 9).
 AMOUNT_BUCKETS : list
     Liste de dictionnaires définissant les plages de distribution des montants de transactions.
 LOG_LEVEL : str
@@ -41,10 +61,14 @@ from typing import Final
 API_VERSION: Final[str] = "1.0.0"
 API_TITLE: Final[str] = "Transaction API"
 API_DESCRIPTION: Final[str] = "High-performance API for transaction analysis"
+# Same variable as uvicorn's --workers default
+API_WORKERS: Final[int] = int(os.getenv("WEB_CONCURRENCY", 1))
 
 # Data Configuration
 CSV_FILE_PATH: Final[str] = os.getenv("CSV_FILE_PATH", "data/transactions.csv")
 CHUNK_SIZE: Final[int] = 10000  # Number of rows to read at a time
+CSV_PARALLEL_MIN_BYTES: Final[int] = 64 * 1024 * 1024
+CSV_WORKERS: Final[int] = int(os.getenv("CSV_WORKERS", os.cpu_count() or 1))
 
 # Pagination Configuration
 DEFAULT_LIMIT: Final[int] = 50
@@ -55,6 +79,24 @@ MIN_LIMIT: Final[int] = 1
 RESPONSE_TIME_THRESHOLD_MS: Final[float] = 500.0
 COMPLEX_QUERY_THRESHOLD_MS: Final[float] = 1000.0
 
+# Cache Configuration
+CACHE_TTL_SECONDS: Final[float] = float(os.getenv("CACHE_TTL_SECONDS", 60))
+CACHE_MAX_ENTRIES: Final[int] = 256
+ETAG_PATH_PREFIXES: Final[tuple] = (
+    "/api/stats",
+    "/api/fraud/summary",
+    "/api/fraud/by-type",
+    "/api/system/metadata",
+    "/api/dashboard",
+    "/api/customers",
+    "/api/transaction/Type/types",
+    "/api/transaction/Latest/recent",
+)
+
+# Compression Configuration
+GZIP_MINIMUM_SIZE: Final[int] = 1024
+GZIP_COMPRESS_LEVEL: Final[int] = 5
+
 # Amount Distribution Buckets
 AMOUNT_BUCKETS: Final[list] = [
     {"min": 0, "max": 100, "label": "0-100"},
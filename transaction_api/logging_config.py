@@ -11,12 +11,18 @@ get_logger(name)
     Obtenir une instance de logger pour un module spécifique.
 """
 
+import atexit
 import logging
 import logging.config
-from typing import Dict, Any
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Any, Optional
 
 from transaction_api.config import LOG_LEVEL, LOG_FORMAT
 
+# Background thread writing the records queued by the request handlers
+_listener: Optional[QueueListener] = None
+
 
 def setup_logging() -> None:
     """Configurer le logging.
@@ -24,6 +30,9 @@ def setup_logging() -> None:
     Configure le logging avec à la fois des gestionnaires de console et de fichier
     en utilisant les paramètres du module de configuration. Crée un fichier de log
     à 'transaction_api.log' et diffuse les logs sur la console avec un formatage cohérent.
+    Ces gestionnaires sont servis par un ``QueueListener`` : le logger racine
+    ne fait que déposer les enregistrements dans une file, de sorte que les
+    écritures console et fichier ne bloquent pas la boucle d'événements.
     
     Retours
     -------
@@ -66,6 +75,26 @@ def setup_logging() -> None:
     }
     logging.config.dictConfig(logging_config)
 
+    global _listener
+    if _listener is None:
+        atexit.register(_stop_listener)
+    else:
+        _listener.stop()
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    """Vider la file de logs et arrêter le thread d'écriture à la sortie."""
+    if _listener is not None:
+        _listener.stop()
+
 
 def get_logger(name: str) -> logging.Logger:
     """Obtenir une instance de logger.
@@ -15,6 +15,8 @@ invalid_pagination_handler(request, exc)
     Gestionnaire d'exception pour les erreurs InvalidPaginationParameters.
 invalid_search_filters_handler(request, exc)
     Gestionnaire d'exception pour les erreurs InvalidSearchFilters.
+conditional_get(request, call_next)
+    Middleware servant les agrégations avec un ETag et des réponses 304.
 general_exception_handler(request, exc)
     Gestionnaire d'exception pour les exceptions générales.
 health_check()
@@ -25,11 +27,20 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 
 import uvicorn
-from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, Response, status
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from transaction_api import app_context
-from transaction_api.config import API_DESCRIPTION, API_TITLE, API_VERSION
+from transaction_api.config import (
+    API_DESCRIPTION,
+    API_TITLE,
+    API_VERSION,
+    API_WORKERS,
+    ETAG_PATH_PREFIXES,
+    GZIP_COMPRESS_LEVEL,
+    GZIP_MINIMUM_SIZE,
+)
 from transaction_api.exceptions import (
     CustomerNotFound,
     InvalidPaginationParameters,
@@ -44,6 +55,7 @@ from transaction_api.routes import (
     fraud_routes as fraud_routes_mod,
     customer_routes as customer_routes_mod,
     system_routes as system_routes_mod,
+    dashboard_routes as dashboard_routes_mod,
 )
 
 transaction_router = transaction_routes_mod.router
@@ -51,6 +63,7 @@ statistics_router = statistics_routes_mod.router
 fraud_router = fraud_routes_mod.router
 customer_router = customer_routes_mod.router
 system_router = system_routes_mod.router
+dashboard_router = dashboard_routes_mod.router
 
 # Set up logging
 setup_logging()
@@ -83,24 +96,76 @@ async def lifespan(app: FastAPI):
     try:
         logger.info("Loading transaction data from CSV")
         app_context.repository.load_from_csv()
-        total_transactions = len(app_context.repository.get_all_transactions())
-        logger.info(f"Successfully loaded {total_transactions} transactions")
+        total_transactions = app_context.repository.count()
+        logger.info("Successfully loaded %d transactions", total_transactions)
     except Exception as e:
-        logger.error(f"Failed to load transaction data: {e}")
+        logger.error("Failed to load transaction data: %s", e)
         raise
     yield
     logger.info("Shutting down Transaction API")
 
 
-# Create FastAPI app
+# Create FastAPI app; responses are encoded with orjson
 app = FastAPI(
     title=API_TITLE,
     description=API_DESCRIPTION,
     version=API_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Compress large JSON bodies (transaction listings repeat the same keys)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=GZIP_MINIMUM_SIZE,
+    compresslevel=GZIP_COMPRESS_LEVEL,
 )
 
 
+@app.middleware("http")
+async def conditional_get(request: Request, call_next):
+    """Servir les agrégations avec un ETag et des réponses 304.
+    
+    L'ETag est dérivé de la date de chargement et de la version des données
+    du référentiel : il reste identique tant qu'aucune transaction n'est
+    insérée ou supprimée. Un client qui renvoie cet ETag dans
+    ``If-None-Match`` reçoit une réponse 304 sans que la route soit exécutée.
+    
+    Paramètres
+    ----------
+    request : Request
+        L'objet de requête HTTP.
+    call_next : Callable
+        Suite de la chaîne de traitement de la requête.
+    
+    Retours
+    -------
+    Response
+        Réponse 304 vide, ou réponse de la route avec l'en-tête ETag.
+    """
+    repository = app_context.repository
+    if (
+        repository is None
+        or request.method != "GET"
+        or not request.url.path.startswith(ETAG_PATH_PREFIXES)
+    ):
+        return await call_next(request)
+
+    loaded_at = repository.data_load_date
+    generation = int(loaded_at.timestamp()) if loaded_at else 0
+    etag = f'W/"{generation}-{repository.data_version}"'
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    response = await call_next(request)
+    if response.status_code == status.HTTP_200_OK:
+        response.headers["ETag"] = etag
+    return response
+
+
 @app.exception_handler(TransactionNotFound)
 async def transaction_not_found_handler(
     request: Request, exc: TransactionNotFound
@@ -121,6 +186,7 @@ async def transaction_not_found_handler(
     JSONResponse
         Réponse JSON avec les détails d'erreur et le code de statut 404.
     """
+    logger.warning("Transaction not found: %s", exc)
     return JSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
         content={
@@ -180,6 +246,7 @@ async def invalid_pagination_handler(
     JSONResponse
         Réponse JSON avec les détails d'erreur et le code de statut 400.
     """
+    logger.warning("Invalid pagination parameters: %s", exc)
     return JSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content={
@@ -238,7 +305,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     JSONResponse
         Réponse JSON avec les détails d'erreur et le code de statut 500.
     """
-    logger.error(f"Unexpected error: {exc}", exc_info=True)
+    logger.error("Unexpected error: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
@@ -270,11 +337,15 @@ async def health_check():
 
 def run() -> None:
     """Launch the FastAPI application using Uvicorn."""
+    # "auto" picks uvloop and httptools when uvicorn[standard] is installed
     uvicorn.run(
         "transaction_api.main:app",
         host="0.0.0.0",
         port=8000,
         reload=False,
+        workers=API_WORKERS,
+        loop="auto",
+        http="auto",
     )
 
 
@@ -284,6 +355,7 @@ app.include_router(statistics_router)
 app.include_router(fraud_router)
 app.include_router(customer_router)
 app.include_router(system_router)
+app.include_router(dashboard_router)
 
 
 if __name__ == "__main__":
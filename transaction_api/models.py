@@ -7,7 +7,8 @@ la détection de fraude et les informations sur les clients.
 Classes
 -------
 Transaction
-    Représente un enregistrement de transaction unique avec tous les détails associés.
+    Représente un enregistrement de transaction unique avec tous les détails associés
+    (dataclass immuable à ``__slots__``).
 PaginationMetadata
     Contient les informations de pagination pour les réponses paginées.
 PaginatedResponse
@@ -30,6 +31,8 @@ FraudUseChipStats
     Statistiques de fraude ventilées par type use_chip.
 FraudPrediction
     Résultat de la prédiction de fraude pour une transaction.
+DashboardStats
+    Agrégats statistiques et de fraude réunis pour un tableau de bord.
 Customer
     Détails du client et résumé des transactions.
 TopCustomer
@@ -50,18 +53,45 @@ from datetime import date as date_type
 from datetime import datetime
 from typing import Generic, List, Optional, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 
 T = TypeVar("T")
 
 
-class Transaction(BaseModel):
+@dataclass(
+    slots=True,
+    frozen=True,
+    config=ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id": "1",
+                "date": "2023-01-01T12:00:00",
+                "client_id": "C001",
+                "card_id": "CARD001",
+                "amount": 100.50,
+                "use_chip": "Swipe Transaction",
+                "merchant_id": "M001",
+                "merchant_city": "New York",
+                "merchant_state": "NY",
+                "zip": "10001",
+                "mcc": "5411",
+                "errors": None,
+            }
+        }
+    ),
+)
+class Transaction:
     """Modèle de données de transaction.
     
     Représente un enregistrement de transaction unique avec tous les détails associés,
     y compris la date, les informations du client, les détails de la carte, les
     informations du commerçant et le montant.
     
+    Déclaré comme dataclass Pydantic immuable à ``__slots__`` : les instances
+    n'ont pas de ``__dict__``, ce qui réduit la mémoire par ligne du référentiel
+    et accélère l'accès aux attributs, tout en conservant la validation.
+    
     Attributs
     ---------
     id : str
@@ -120,29 +150,6 @@ class Transaction(BaseModel):
     mcc: str = Field(..., description="Merchant category code")
     errors: Optional[str] = Field(None, description="Error flag")
 
-    class Config:
-        """Configuration Pydantic pour le modèle Transaction.
-        
-        Fournit un exemple de schéma JSON pour la documentation de l'API.
-        """
-
-        json_schema_extra = {
-            "example": {
-                "id": "1",
-                "date": "2023-01-01T12:00:00",
-                "client_id": "C001",
-                "card_id": "CARD001",
-                "amount": 100.50,
-                "use_chip": "Swipe Transaction",
-                "merchant_id": "M001",
-                "merchant_city": "New York",
-                "merchant_state": "NY",
-                "zip": "10001",
-                "mcc": "5411",
-                "errors": None,
-            }
-        }
-
 
 class PaginationMetadata(BaseModel):
     """Métadonnées de pagination.
@@ -162,6 +169,9 @@ class PaginationMetadata(BaseModel):
         Nombre total de pages disponibles.
     has_next_page : bool
         Indique s'il y a une page suivante disponible.
+    next_cursor : str, optionnel
+        Curseur à transmettre pour obtenir la page suivante, pour les listes
+        qui supportent la pagination par curseur.
     """
 
     page: int = Field(..., description="Current page number")
@@ -169,6 +179,7 @@ class PaginationMetadata(BaseModel):
     total_count: int = Field(..., description="Total items")
     total_pages: int = Field(..., description="Total pages")
     has_next_page: bool = Field(..., description="Has next page")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page")
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -388,6 +399,34 @@ class FraudPrediction(BaseModel):
     reasoning: str = Field(..., description="Reasoning")
 
 
+class DashboardStats(BaseModel):
+    """Statistiques du tableau de bord.
+    
+    Réunit en une seule réponse les agrégats affichés par un tableau de bord.
+    
+    Attributs
+    ---------
+    overview : OverviewStats
+        Statistiques générales.
+    amount_distribution : AmountDistribution
+        Distribution des montants par plages.
+    stats_by_type : List[TypeStats]
+        Statistiques par type de transaction.
+    daily_stats : List[dict]
+        Statistiques quotidiennes.
+    fraud_summary : FraudSummary
+        Résumé de la détection de fraude.
+    """
+
+    overview: OverviewStats = Field(..., description="Overview")
+    amount_distribution: AmountDistribution = Field(
+        ..., description="Amount distribution"
+    )
+    stats_by_type: List[TypeStats] = Field(..., description="Stats by type")
+    daily_stats: List[dict] = Field(..., description="Daily stats")
+    fraud_summary: FraudSummary = Field(..., description="Fraud summary")
+
+
 class Customer(BaseModel):
     """Détails du client.
     
@@ -16,7 +16,7 @@ create_paginated_response(data, page, limit, total_count)
     Créer une réponse paginée avec les métadonnées.
 """
 
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 from transaction_api.config import MAX_LIMIT, MIN_LIMIT
 from transaction_api.exceptions import InvalidPaginationParameters
@@ -72,7 +72,11 @@ class PaginationService(Generic[T]):
 
     @staticmethod
     def create_paginated_response(
-        data: List[T], page: int, limit: int, total_count: int
+        data: List[T],
+        page: int,
+        limit: int,
+        total_count: int,
+        next_cursor: Optional[str] = None,
     ) -> PaginatedResponse[T]:
         """Créer une réponse paginée.
         
@@ -89,6 +93,8 @@ class PaginationService(Generic[T]):
             Nombre d'éléments par page.
         total_count : int
             Nombre total d'éléments sur toutes les pages.
+        next_cursor : str, optionnel
+            Curseur de la page suivante, pour la pagination par curseur.
         
         Retours
         -------
@@ -113,6 +119,7 @@ class PaginationService(Generic[T]):
             total_count=total_count,
             total_pages=total_pages,
             has_next_page=has_next_page,
+            next_cursor=next_cursor,
         )
 
         return PaginatedResponse(data=data, pagination=pagination_metadata)
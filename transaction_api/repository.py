@@ -11,19 +11,238 @@ TransactionRepository
 """
 
 import csv
+import io
+import math
+import os
+import threading
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache, wraps
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+import numpy as np
 import pandas as pd
 
-from transaction_api.config import CHUNK_SIZE
+from transaction_api.config import CHUNK_SIZE, CSV_PARALLEL_MIN_BYTES, CSV_WORKERS
 from transaction_api.exceptions import InvalidTransactionData
 from transaction_api.logging_config import get_logger
 from transaction_api.models import SearchFilters, Transaction
 
 logger = get_logger(__name__)
 
+# Format of the "date" column in the CSV file
+DATE_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+
+# CSV columns read by the loader
+CSV_COLUMNS: Tuple[str, ...] = (
+    "id",
+    "date",
+    "client_id",
+    "card_id",
+    "amount",
+    "use_chip",
+    "merchant_id",
+    "merchant_city",
+    "merchant_state",
+    "zip",
+    "mcc",
+    "errors",
+)
+
+
+def _read_csv(
+    source: Union[str, IO[bytes]], **kwargs: Any
+) -> Iterator[pd.DataFrame]:
+    """Lire un CSV de transactions par lots avec le parseur C de pandas.
+    
+    Le fichier est lu par lots de ``CHUNK_SIZE`` lignes, de sorte que la
+    mémoire de travail reste bornée quelle que soit sa taille. Toutes les
+    colonnes sont lues comme chaînes, sans inférence de type ni conversion des
+    valeurs vides en NaN ; les conversions sont faites ensuite colonne par
+    colonne. Les lignes vides sont conservées pour que les numéros de ligne
+    restent ceux du fichier ; les lignes avec trop de champs sont signalées
+    puis ignorées.
+    
+    Paramètres
+    ----------
+    source : str ou IO[bytes]
+        Chemin ou flux binaire du fichier CSV.
+    **kwargs : Any
+        Options supplémentaires passées à ``pd.read_csv``.
+    
+    Retours
+    -------
+    Iterator[pd.DataFrame]
+        Les lots de lignes du fichier, colonnes nommées d'après l'en-tête.
+    
+    Lève
+    ----
+    pd.errors.EmptyDataError
+        Si le fichier est vide.
+    """
+    with pd.read_csv(
+        source,
+        dtype=str,
+        keep_default_na=False,
+        skip_blank_lines=False,
+        on_bad_lines="warn",
+        engine="c",
+        chunksize=CHUNK_SIZE,
+        **kwargs,
+    ) as reader:
+        for frame in reader:
+            frame.columns = [str(name).strip() for name in frame.columns]
+            yield frame
+
+
+def _parse_byte_range(
+    filepath: str, start: int, stop: int, header: List[str]
+) -> Tuple[int, List[Transaction], List[Tuple[int, str]]]:
+    """Analyser une plage d'octets du fichier CSV dans un processus de travail.
+    
+    La plage commence et se termine sur une fin de ligne. Les numéros de ligne
+    retournés sont relatifs au début de la plage.
+    
+    Paramètres
+    ----------
+    filepath : str
+        Chemin vers le fichier CSV.
+    start : int
+        Position du premier octet de la plage.
+    stop : int
+        Position suivant le dernier octet de la plage.
+    header : List[str]
+        Noms des colonnes du fichier.
+    
+    Retours
+    -------
+    Tuple[int, List[Transaction], List[Tuple[int, str]]]
+        Tuple de (nombre de lignes de la plage, transactions analysées,
+        erreurs (numéro de ligne relatif, message)).
+    """
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        data = f.read(stop - start)
+
+    line_count = data.count(b"\n")
+    if data and not data.endswith(b"\n"):
+        line_count += 1
+    if not data.strip():
+        return line_count, [], []
+
+    repository = TransactionRepository()
+    transactions: List[Transaction] = []
+    errors: List[Tuple[int, str]] = []
+    first_row = 0
+    for frame in _read_csv(io.BytesIO(data), header=None, names=header):
+        parsed, failed = repository._parse_frame(frame, first_row)
+        transactions.extend(parsed)
+        errors.extend(failed)
+        first_row += len(frame)
+    return line_count, transactions, errors
+
+
+# Equality search filters: (SearchFilters field, column, categorical),
+# ordered from the most to the least selective
+SEARCH_EQUALITY_FILTERS: Tuple[Tuple[str, str, bool], ...] = (
+    ("transaction_id", "id", False),
+    ("client_id", "client_id", True),
+    ("merchant_city", "merchant_city", True),
+    ("use_chip", "use_chip", True),
+)
+
+
+@lru_cache(maxsize=None)
+def _search_plan(shape: Tuple[bool, ...]) -> Tuple[Tuple[str, str, bool], ...]:
+    """Obtenir le plan de recherche pour une forme de filtres.
+    
+    La forme indique quels filtres d'égalité sont renseignés ; le plan
+    correspondant (filtres actifs, dans l'ordre de sélectivité) est calculé une
+    seule fois par forme puis réutilisé par toutes les recherches de même forme.
+    
+    Paramètres
+    ----------
+    shape : Tuple[bool, ...]
+        Pour chaque entrée de ``SEARCH_EQUALITY_FILTERS``, True si le filtre
+        est renseigné.
+    
+    Retours
+    -------
+    Tuple[Tuple[str, str, bool], ...]
+        Filtres actifs de ``SEARCH_EQUALITY_FILTERS``.
+    """
+    return tuple(
+        entry for entry, active in zip(SEARCH_EQUALITY_FILTERS, shape) if active
+    )
+
+
+# Low-cardinality string columns stored as integer category codes
+CATEGORICAL_COLUMNS: Tuple[str, ...] = (
+    "use_chip",
+    "mcc",
+    "merchant_state",
+    "merchant_city",
+)
+
+# Key columns stored as integer codes and grouped CSR-style for lookups
+GROUPED_COLUMNS: Tuple[str, ...] = ("client_id", "merchant_id")
+
+# All columns stored as integer codes
+CODED_COLUMNS: Tuple[str, ...] = CATEGORICAL_COLUMNS + GROUPED_COLUMNS
+
+# Columns of the repository's column store and their dtypes
+COLUMN_DTYPES: Dict[str, Any] = {
+    "id": object,
+    "transaction": object,
+    "seq": np.int64,
+    "date_ts": np.int64,
+    "amount": np.float64,
+    "is_fraud": np.bool_,
+    **{column: np.int32 for column in CODED_COLUMNS},
+}
+
+# Minimum number of rows allocated when the column store grows
+MIN_COLUMN_CAPACITY: int = 1024
+
+# Length of a day in the unit of the date_ts column
+MICROSECONDS_PER_DAY: int = 86_400_000_000
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def _synchronized(method: _Method) -> _Method:
+    """Exécuter une méthode du référentiel sous son verrou.
+    
+    Paramètres
+    ----------
+    method : Callable
+        Méthode de ``TransactionRepository`` lisant ou modifiant le stockage.
+    
+    Retours
+    -------
+    Callable
+        La méthode, qui prend ``self.lock`` pendant toute sa durée.
+    """
+
+    @wraps(method)
+    def wrapper(self: "TransactionRepository", *args: Any, **kwargs: Any) -> Any:
+        with self.lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
 
 class TransactionRepository:
     """Référentiel pour gérer les transactions.
@@ -36,24 +255,73 @@ class TransactionRepository:
     ---------
     transactions : Dict[str, Transaction]
         Dictionnaire mappant les ID de transaction aux objets Transaction.
-    customer_index : Dict[str, List[str]]
-        Index mappant les ID client aux listes d'ID de transaction.
-    merchant_index : Dict[str, List[str]]
-        Index mappant les ID commerçant aux listes d'ID de transaction.
-    date_index : List[str]
-        Liste des ID de transaction triés par date.
-    type_index : Dict[str, List[str]]
-        Index mappant les codes de catégorie de commerçant aux listes d'ID de transaction.
-    use_chip_index : Dict[str, List[str]]
-        Index mappant les types use_chip aux listes d'ID de transaction.
-    fraud_index : List[str]
-        Liste des ID de transaction signalés comme frauduleux.
-    data_load_date : datetime, optionnel
-        Quand les données de transaction ont été chargées.
+    date_index : Dict[str, None]
+        ID de transaction dans l'ordre d'insertion.
+    type_index : Dict[str, Dict[str, None]]
+        Index mappant les codes de catégorie de commerçant aux ID de transaction.
+        Les ID sont les clés d'un dictionnaire (ordre d'insertion conservé,
+        suppression en O(1)).
+    use_chip_index : Dict[str, Dict[str, None]]
+        Index mappant les types use_chip aux ID de transaction.
+    fraud_index : Dict[str, None]
+        ID de transaction signalés comme frauduleux.
+    fraud_amount : float
+        Somme courante des montants des transactions frauduleuses, tenue à
+        jour à chaque insertion et suppression.
+    total_amount : float
+        Somme courante des montants de toutes les transactions, tenue à jour
+        à chaque insertion et suppression.
+    data_load_date : datetime
+        Quand les données de transaction ont été chargées ; avant tout
+        chargement, date de création du référentiel.
+    data_version : int
+        Compteur incrémenté à chaque insertion ou suppression, permettant aux
+        services de mettre en cache des agrégats tant que les données sont
+        inchangées.
     min_date : datetime, optionnel
-        Date de transaction la plus ancienne du référentiel.
+        Date de transaction la plus ancienne du référentiel, calculée par une
+        réduction vectorisée sur la colonne des dates.
     max_date : datetime, optionnel
         Date de transaction la plus récente du référentiel.
+    sorted_customer_ids : np.ndarray
+        ID client uniques triés, partagés par toutes les pages de la liste des
+        clients au lieu d'être triés à chaque requête.
+    lock : threading.RLock
+        Verrou réentrant pris par chaque méthode publique et par les
+        insertions : les suppressions modifient les colonnes sur place, et
+        les routes lisent le référentiel depuis des threads de travail. Les
+        lectures et les écritures sont donc sérialisées.
+    _columns : Dict[str, np.ndarray]
+        Stockage colonnaire des transactions (structure de tableaux) : ID,
+        objets Transaction, numéro d'ordre d'insertion, dates en epoch int64,
+        ID client, montants, indicateur de fraude et codes de catégorie. Les
+        tableaux ont une capacité supérieure au nombre de lignes et sont tenus
+        à jour à chaque insertion et suppression.
+    _size : int
+        Nombre de lignes occupées dans ``_columns``.
+    _row_index : Dict[str, int]
+        Position de chaque ID de transaction dans ``_columns``.
+    _date_order : np.ndarray, optionnel
+        Positions de toutes les lignes triées par date décroissante (puis par
+        ordre d'insertion), construites à la première lecture qui en a besoin
+        (pagination, statistiques quotidiennes) puis tenues à jour par fusion
+        à chaque insertion et suppression.
+    _derived : Dict[str, np.ndarray]
+        Tableaux dérivés des colonnes (permutation des montants triés),
+        calculés à la demande et remplacés par un dictionnaire vide à chaque
+        modification.
+    _vocabularies : Dict[str, Dict[str, int]]
+        Dictionnaires valeur -> code pour les colonnes à faible cardinalité.
+    _categories : Dict[str, List[str]]
+        Dictionnaires inverses code -> valeur pour ces mêmes colonnes.
+    _strings : Dict[str, str]
+        Table d'internement des valeurs répétées des colonnes catégorielles,
+        partagées par toutes les transactions chargées.
+    _customer_views : Dict[str, List[Transaction]]
+        Transactions de chaque client déjà triées par date décroissante,
+        mémorisées à la première lecture et invalidées par client.
+    _merchant_views : Dict[str, List[Transaction]]
+        Même mémorisation pour chaque commerçant.
     """
 
     def __init__(self) -> None:
@@ -62,16 +330,35 @@ class TransactionRepository:
         Crée des structures de données vides pour stocker les transactions et les index.
         """
         self.transactions: Dict[str, Transaction] = {}
-        self.customer_index: Dict[str, List[str]] = defaultdict(list)
-        self.merchant_index: Dict[str, List[str]] = defaultdict(list)
-        self.date_index: List[str] = []
-        self.type_index: Dict[str, List[str]] = defaultdict(list)
-        self.use_chip_index: Dict[str, List[str]] = defaultdict(list)
-        self.fraud_index: List[str] = []
-        self.data_load_date: Optional[datetime] = None
-        self.min_date: Optional[datetime] = None
-        self.max_date: Optional[datetime] = None
+        self.date_index: Dict[str, None] = {}
+        self.type_index: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self.use_chip_index: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self.fraud_index: Dict[str, None] = {}
+        self.fraud_amount = 0.0
+        self.total_amount = 0.0
+        self.data_load_date: datetime = datetime.utcnow()
+        self.data_version = 0
+        self.lock = threading.RLock()
+        self._columns: Dict[str, np.ndarray] = {
+            column: np.empty(0, dtype=dtype)
+            for column, dtype in COLUMN_DTYPES.items()
+        }
+        self._size = 0
+        self._next_seq = 0
+        self._row_index: Dict[str, int] = {}
+        self._date_order: Optional[np.ndarray] = None
+        self._derived: Dict[str, np.ndarray] = {}
+        self._strings: Dict[str, str] = {}
+        self._customer_views: Dict[str, List[Transaction]] = {}
+        self._merchant_views: Dict[str, List[Transaction]] = {}
+        self._vocabularies: Dict[str, Dict[str, int]] = {
+            column: {} for column in CODED_COLUMNS
+        }
+        self._categories: Dict[str, List[str]] = {
+            column: [] for column in CODED_COLUMNS
+        }
 
+    @_synchronized
     def load_from_csv(self, filepath: Optional[str] = None) -> None:
         """Charger les transactions à partir d'un fichier CSV.
         
@@ -99,128 +386,760 @@ class TransactionRepository:
         if filepath is None:
             filepath = "./data/transactions.csv"
 
-        logger.info(f"Loading transactions from {filepath}")
-        loaded_count = 0
-        error_count = 0
+        logger.info("Loading transactions from %s", filepath)
 
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                if reader.fieldnames is None:
-                    raise InvalidTransactionData("CSV file has no headers")
-
-                for row_num, row in enumerate(reader, start=2):
-                    try:
-                        # Skip empty rows
-                        if not row or not row.get("id", "").strip():
-                            continue
-
-                        transaction = self._parse_transaction(row)
-                        self._add_transaction(transaction)
-                        loaded_count += 1
-
-                        if loaded_count % CHUNK_SIZE == 0:
-                            logger.info(f"Loaded {loaded_count} transactions")
-                    except Exception as e:
-                        error_count += 1
-                        logger.warning(
-                            f"Error loading transaction at row {row_num}: {e}"
-                        )
+            if (
+                CSV_WORKERS > 1
+                and os.path.getsize(filepath) >= CSV_PARALLEL_MIN_BYTES
+            ):
+                loaded_count, error_count = self._load_parallel(
+                    filepath, CSV_WORKERS
+                )
+            else:
+                loaded_count, error_count = self._load_sequential(filepath)
 
             self.data_load_date = datetime.utcnow()
-            logger.info(f"Transaction :{loaded_count}. Error: {error_count}")
+            logger.info("Transaction :%d. Error: %d", loaded_count, error_count)
         except FileNotFoundError:
-            logger.error(f"CSV file not found: {filepath}")
+            logger.error("CSV file not found: %s", filepath)
             raise
         except Exception as e:
-            logger.error(f"Error loading CSV file: {e}")
+            logger.error("Error loading CSV file: %s", e)
             raise
 
-    def _parse_transaction(self, row: Dict[str, str]) -> Transaction:
-        """Analyser une transaction à partir d'une ligne CSV.
+    def _load_sequential(self, filepath: str) -> Tuple[int, int]:
+        """Charger le fichier CSV dans le processus courant.
         
-        Analyse un dictionnaire de ligne CSV en un objet Transaction, en gérant
-        les conversions de type et la validation des données.
+        Le fichier est lu par ``pd.read_csv`` en flux, par lots de
+        ``CHUNK_SIZE`` lignes convertis et insérés l'un après l'autre : seul
+        le lot courant est conservé sous forme de DataFrame. Le fichier est
+        projeté en mémoire (``memory_map=True``) et tokenisé directement
+        depuis les pages du fichier.
         
         Paramètres
         ----------
-        row : Dict[str, str]
-            Dictionnaire représentant une ligne CSV avec les données de transaction.
+        filepath : str
+            Chemin vers le fichier CSV.
         
         Retours
         -------
-        Transaction
-            Objet Transaction analysé.
+        Tuple[int, int]
+            Tuple de (transactions chargées, lignes en erreur).
         
         Lève
         ----
         InvalidTransactionData
-            Si la ligne contient des données invalides ou manquantes requises.
+            Si le fichier CSV n'a pas d'en-têtes.
         """
+        loaded_count = 0
+        error_count = 0
+        first_row = 2
         try:
-            # Get date string and handle empty values
-            date_str = row.get("date", "").strip()
-            if not date_str:
-                raise ValueError("Date is empty")
-
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-
-            # Parse amount - remove $ if present
-            amount_str = row.get("amount", "0").strip()
-            if amount_str.startswith("$"):
-                amount_str = amount_str[1:]
-            amount = float(amount_str)
-            use_chip = row.get("use_chip", "").strip()
-
-            # Get ID and handle empty values
-            transaction_id = row.get("id", "").strip()
-            if not transaction_id:
-                raise ValueError("Transaction ID is empty")
-
-            transaction = Transaction(
-                id=transaction_id,
-                date=date_obj,
-                client_id=row.get("client_id", "").strip(),
-                card_id=row.get("card_id", "").strip(),
-                amount=amount,
-                use_chip=use_chip,
-                merchant_id=row.get("merchant_id", "").strip(),
-                merchant_city=row.get("merchant_city", "").strip(),
-                merchant_state=row.get("merchant_state", "").strip(),
-                zip=row.get("zip", "").strip(),
-                mcc=row.get("mcc", "").strip(),
-                errors=row.get("errors", "").strip() or None,
+            for frame in _read_csv(filepath, memory_map=True):
+                loaded, failed = self._load_chunk(frame, first_row)
+                loaded_count += loaded
+                error_count += failed
+                first_row += len(frame)
+                logger.info("Loaded %d transactions", loaded_count)
+        except pd.errors.EmptyDataError:
+            raise InvalidTransactionData("CSV file has no headers")
+        return loaded_count, error_count
+
+    def _load_parallel(self, filepath: str, workers: int) -> Tuple[int, int]:
+        """Charger le fichier CSV en plages d'octets analysées en parallèle.
+        
+        Le corps du fichier est découpé en ``workers`` plages alignées sur des
+        fins de ligne, analysées chacune par un processus de travail. Les
+        résultats sont insérés dans l'ordre du fichier. Les champs entre
+        guillemets contenant un saut de ligne ne sont pas pris en charge : une
+        plage pourrait commencer au milieu d'un tel champ. Comme ``pd.read_csv``
+        pour le chargement séquentiel, la marque d'ordre des octets UTF-8
+        éventuelle est retirée de l'en-tête.
+        
+        Paramètres
+        ----------
+        filepath : str
+            Chemin vers le fichier CSV.
+        workers : int
+            Nombre de processus de travail.
+        
+        Retours
+        -------
+        Tuple[int, int]
+            Tuple de (transactions chargées, lignes en erreur).
+        
+        Lève
+        ----
+        InvalidTransactionData
+            Si le fichier CSV n'a pas d'en-têtes.
+        """
+        size = os.path.getsize(filepath)
+        with open(filepath, "rb") as f:
+            # utf-8-sig drops a BOM, which would otherwise prefix the id column
+            header_line = f.readline().decode("utf-8-sig")
+            header = next(csv.reader([header_line]), None)
+            if not header:
+                raise InvalidTransactionData("CSV file has no headers")
+
+            # Move every boundary to the end of the line it falls in
+            body_start = f.tell()
+            step = max((size - body_start) // workers, 1)
+            boundaries = [body_start]
+            for worker in range(1, workers):
+                f.seek(body_start + step * worker - 1)
+                f.readline()
+                if boundaries[-1] < f.tell() < size:
+                    boundaries.append(f.tell())
+            boundaries.append(size)
+
+        loaded_count = 0
+        error_count = 0
+        row_offset = 2
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_parse_byte_range, filepath, start, stop, header)
+                for start, stop in zip(boundaries, boundaries[1:])
+            ]
+            for future in futures:
+                line_count, transactions, errors = future.result()
+                for row_num, message in errors:
+                    logger.warning(
+                        "Error loading transaction at row %s: %s",
+                        row_offset + row_num,
+                        message,
+                    )
+                self._add_transactions_bulk(transactions)
+                loaded_count += len(transactions)
+                error_count += len(errors)
+                row_offset += line_count
+                logger.info("Loaded %d transactions", loaded_count)
+
+        return loaded_count, error_count
+
+    def _load_chunk(self, frame: pd.DataFrame, first_row: int) -> Tuple[int, int]:
+        """Charger un lot de lignes CSV dans le référentiel.
+        
+        Analyse le lot avec ``_parse_frame``, journalise les lignes invalides
+        sans interrompre le chargement, puis ajoute les transactions valides en
+        une seule insertion groupée.
+        
+        Paramètres
+        ----------
+        frame : pd.DataFrame
+            Lignes du lot, lues par ``_read_csv``.
+        first_row : int
+            Numéro de ligne de la première ligne du lot dans le fichier.
+        
+        Retours
+        -------
+        Tuple[int, int]
+            Tuple de (transactions chargées, lignes en erreur).
+        """
+        transactions, errors = self._parse_frame(frame, first_row)
+        for row_num, message in errors:
+            logger.warning(
+                "Error loading transaction at row %s: %s", row_num, message
+            )
+
+        self._add_transactions_bulk(transactions)
+        return len(transactions), len(errors)
+
+    def _parse_frame(
+        self, frame: pd.DataFrame, first_row: int
+    ) -> Tuple[List[Transaction], List[Tuple[int, str]]]:
+        """Analyser un lot de lignes CSV en transactions.
+        
+        Les conversions sont vectorisées par colonne : dates par un seul appel
+        à ``pd.to_datetime`` (avec cache des valeurs répétées), montants par
+        ``pd.to_numeric`` après retrait du symbole ``$``, et valeurs des
+        colonnes catégorielles partagées via ``pd.factorize``. Les espaces
+        autour des valeurs sont retirés une fois par colonne, avant toute
+        conversion. Seule la construction des objets Transaction reste par
+        ligne. Les lignes sans ID sont ignorées ; un montant vide est une
+        erreur, un montant absent du fichier vaut 0.
+        
+        Paramètres
+        ----------
+        frame : pd.DataFrame
+            Lignes du lot, lues par ``_read_csv``. Les colonnes absentes sont
+            lues comme des chaînes vides.
+        first_row : int
+            Numéro de ligne de la première ligne du lot.
+        
+        Retours
+        -------
+        Tuple[List[Transaction], List[Tuple[int, str]]]
+            Tuple de (transactions valides, erreurs (numéro de ligne, message)).
+        """
+        size = len(frame)
+        # Strip once per column; a missing amount column reads as 0
+        values = {
+            name: (
+                frame[name].fillna("").str.strip().to_numpy(dtype=object)
+                if name in frame.columns
+                else np.full(size, "0" if name == "amount" else "", dtype=object)
+            )
+            for name in CSV_COLUMNS
+        }
+
+        # Share one string object per distinct low-cardinality value
+        for name in ("use_chip", "merchant_city", "merchant_state", "mcc"):
+            codes, uniques = pd.factorize(values[name])
+            shared = np.array(
+                [self._strings.setdefault(value, value) for value in uniques],
+                dtype=object,
             )
-            return transaction
-        except (ValueError, KeyError) as e:
-            raise InvalidTransactionData(f"Invalid transaction data: {e}")
+            values[name] = shared[codes] if size else values[name]
 
+        dates = pd.to_datetime(
+            values["date"], format=DATE_FORMAT, errors="coerce", cache=True
+        )
+        invalid_dates = dates.isna()
+        parsed_dates = dates.to_pydatetime()
+
+        # Empty amounts (or a lone "$") coerce to NaN and are rejected
+        amount_text = pd.Series(values["amount"], dtype=object).str.removeprefix("$")
+        amounts = pd.to_numeric(amount_text, errors="coerce").to_numpy(
+            dtype=np.float64
+        )
+        invalid_amounts = np.isnan(amounts)
+
+        transactions: List[Transaction] = []
+        errors: List[Tuple[int, str]] = []
+        rows = zip(
+            values["id"],
+            parsed_dates,
+            values["client_id"],
+            values["card_id"],
+            amounts.tolist(),
+            values["use_chip"],
+            values["merchant_id"],
+            values["merchant_city"],
+            values["merchant_state"],
+            values["zip"],
+            values["mcc"],
+            values["errors"],
+        )
+        for position, (
+            transaction_id,
+            date_obj,
+            client_id,
+            card_id,
+            amount,
+            use_chip,
+            merchant_id,
+            merchant_city,
+            merchant_state,
+            zip_code,
+            mcc,
+            error_flag,
+        ) in enumerate(rows):
+            if not transaction_id:
+                continue
+
+            try:
+                if invalid_dates[position]:
+                    date_str = values["date"][position]
+                    raise InvalidTransactionData(
+                        f"Invalid transaction data: invalid date {date_str!r}"
+                    )
+                if invalid_amounts[position]:
+                    amount_str = values["amount"][position]
+                    raise InvalidTransactionData(
+                        f"Invalid transaction data: invalid amount {amount_str!r}"
+                    )
+
+                transactions.append(
+                    Transaction(
+                        id=transaction_id,
+                        date=date_obj,
+                        client_id=client_id,
+                        card_id=card_id,
+                        amount=amount,
+                        use_chip=use_chip,
+                        merchant_id=merchant_id,
+                        merchant_city=merchant_city,
+                        merchant_state=merchant_state,
+                        zip=zip_code,
+                        mcc=mcc,
+                        errors=error_flag or None,
+                    )
+                )
+            except Exception as e:
+                errors.append((first_row + position, str(e)))
+
+        return transactions, errors
+
+    @_synchronized
     def _add_transaction(self, transaction: Transaction) -> None:
         """Ajouter une transaction au référentiel.
         
         Ajoute une transaction au référentiel et met à jour tous les index.
-        Met à jour les dates min/max si nécessaire.
+        Une transaction existante
+        avec le même ID est remplacée, de sorte que chaque ID indexé désigne
+        toujours une transaction présente.
         
         Paramètres
         ----------
         transaction : Transaction
             La transaction à ajouter.
         """
+        if transaction.id in self.transactions:
+            self.delete(transaction.id)
+
         self.transactions[transaction.id] = transaction
-        self.customer_index[transaction.client_id].append(transaction.id)
-        self.merchant_index[transaction.merchant_id].append(transaction.id)
-        self.type_index[transaction.mcc].append(transaction.id)
-        self.use_chip_index[transaction.use_chip].append(transaction.id)
-        self.date_index.append(transaction.id)
+        self._append_rows([transaction])
+        self._customer_views.pop(transaction.client_id, None)
+        self._merchant_views.pop(transaction.merchant_id, None)
+        self.type_index[transaction.mcc][transaction.id] = None
+        self.use_chip_index[transaction.use_chip][transaction.id] = None
+        self.date_index[transaction.id] = None
+        self.total_amount += transaction.amount
 
         if transaction.errors:
-            self.fraud_index.append(transaction.id)
+            self.fraud_index[transaction.id] = None
+            self.fraud_amount += transaction.amount
+
+    @_synchronized
+    def _add_transactions_bulk(self, transactions: List[Transaction]) -> None:
+        """Ajouter un lot de transactions au référentiel.
+        
+        Équivalent à ``_add_transaction`` appelé sur chaque transaction, mais
+        les identifiants sont d'abord regroupés par clé d'index puis ajoutés
+        avec ``update``, une seule fois par clé et par lot.
+        
+        Paramètres
+        ----------
+        transactions : List[Transaction]
+            Les transactions à ajouter, dans l'ordre de chargement.
+        """
+        if not transactions:
+            return
+
+        # Ids that are repeated or already stored go through the replacing path
+        transaction_ids = {t.id for t in transactions}
+        if len(transaction_ids) < len(transactions) or not (
+            self.transactions.keys().isdisjoint(transaction_ids)
+        ):
+            for transaction in transactions:
+                self._add_transaction(transaction)
+            return
+
+        by_type: Dict[str, List[str]] = defaultdict(list)
+        by_use_chip: Dict[str, List[str]] = defaultdict(list)
+        for transaction in transactions:
+            transaction_id = transaction.id
+            by_type[transaction.mcc].append(transaction_id)
+            by_use_chip[transaction.use_chip].append(transaction_id)
+
+        self.transactions.update((t.id, t) for t in transactions)
+        self._append_rows(transactions)
+        for customer_id in {t.client_id for t in transactions}:
+            self._customer_views.pop(customer_id, None)
+        for merchant_id in {t.merchant_id for t in transactions}:
+            self._merchant_views.pop(merchant_id, None)
+        for index, groups in (
+            (self.type_index, by_type),
+            (self.use_chip_index, by_use_chip),
+        ):
+            for key, transaction_ids in groups.items():
+                index[key].update(dict.fromkeys(transaction_ids))
+        self.date_index.update(dict.fromkeys(t.id for t in transactions))
+        self.total_amount += math.fsum(t.amount for t in transactions)
+        fraud = [t for t in transactions if t.errors]
+        self.fraud_index.update(dict.fromkeys(t.id for t in fraud))
+        self.fraud_amount += math.fsum(t.amount for t in fraud)
+
+    def _intern(self, column: str, value: str) -> int:
+        """Obtenir le code de catégorie d'une valeur.
+        
+        Attribue un nouveau code entier à la valeur si elle n'a encore jamais
+        été vue pour cette colonne.
+        
+        Paramètres
+        ----------
+        column : str
+            Nom de la colonne catégorielle.
+        value : str
+            Valeur à encoder.
+        
+        Retours
+        -------
+        int
+            Code entier de la valeur.
+        """
+        vocabulary = self._vocabularies[column]
+        code = vocabulary.get(value)
+        if code is None:
+            code = len(vocabulary)
+            vocabulary[value] = code
+            self._categories[column].append(value)
+        return code
+
+    def _code_of(self, column: str, value: str) -> int:
+        """Obtenir le code d'une valeur sans l'enregistrer.
+        
+        Paramètres
+        ----------
+        column : str
+            Nom de la colonne catégorielle.
+        value : str
+            Valeur recherchée.
+        
+        Retours
+        -------
+        int
+            Code entier de la valeur, ou -1 si elle est inconnue.
+        """
+        return self._vocabularies[column].get(value, -1)
+
+    @_synchronized
+    def ping(self) -> bool:
+        """Vérifier en O(1) que le référentiel est utilisable.
+        
+        Retours
+        -------
+        bool
+            True si la table des transactions et le stockage colonnaire ont
+            le même nombre de lignes.
+        """
+        return len(self.transactions) == self._size
+
+    @property
+    def min_date(self) -> Optional[datetime]:
+        """Date de transaction la plus ancienne, ou None si le référentiel est vide."""
+        return self._date_bound("date_min")
+
+    @property
+    def max_date(self) -> Optional[datetime]:
+        """Date de transaction la plus récente, ou None si le référentiel est vide."""
+        return self._date_bound("date_max")
+
+    @_synchronized
+    def _date_bound(self, bound: str) -> Optional[datetime]:
+        """Calculer une borne de la colonne des dates.
+        
+        Utilise les extrémités de l'ordre par date s'il est déjà construit,
+        sinon une réduction ``min``/``max`` sur la colonne int64. Le résultat
+        est mémorisé jusqu'à la prochaine modification.
+        
+        Paramètres
+        ----------
+        bound : str
+            "date_min" ou "date_max".
+        
+        Retours
+        -------
+        datetime, optionnel
+            La borne demandée, ou None si le référentiel est vide.
+        """
+        if self._size == 0:
+            return None
+
+        derived = self._derived
+        if bound not in derived:
+            timestamps = self._get_columns()["date_ts"]
+            if self._date_order is not None:
+                # Sorted by date descending: the bounds are the two ends
+                ends = timestamps[self._date_order[[-1, 0]]]
+            else:
+                ends = np.array([timestamps.min(), timestamps.max()])
+            derived["date_min"], derived["date_max"] = ends
+        return np.datetime64(int(derived[bound]), "us").item()
+
+    def _append_rows(self, transactions: List[Transaction]) -> None:
+        """Ajouter des transactions à la fin du stockage colonnaire.
+        
+        Les tableaux sont agrandis par doublement de capacité, de sorte qu'une
+        insertion coûte O(1) amorti au lieu d'une reconstruction complète.
+        
+        Paramètres
+        ----------
+        transactions : List[Transaction]
+            Les transactions à ajouter, absentes du stockage.
+        """
+        count = len(transactions)
+        start = self._size
+        stop = start + count
+        capacity = self._columns["id"].size
+        if stop > capacity:
+            capacity = max(stop, 2 * capacity, MIN_COLUMN_CAPACITY)
+            for column, values in self._columns.items():
+                grown = np.empty(capacity, dtype=values.dtype)
+                grown[:start] = values[:start]
+                self._columns[column] = grown
+
+        columns = self._columns
+        columns["id"][start:stop] = np.fromiter(
+            (t.id for t in transactions), dtype=object, count=count
+        )
+        columns["transaction"][start:stop] = np.fromiter(
+            transactions, dtype=object, count=count
+        )
+        columns["seq"][start:stop] = np.arange(
+            self._next_seq, self._next_seq + count
+        )
+        columns["date_ts"][start:stop] = np.array(
+            [t.date for t in transactions], dtype="datetime64[us]"
+        ).view(np.int64)
+        columns["amount"][start:stop] = np.fromiter(
+            (t.amount for t in transactions), dtype=np.float64, count=count
+        )
+        columns["is_fraud"][start:stop] = np.fromiter(
+            (bool(t.errors) for t in transactions), dtype=np.bool_, count=count
+        )
+        for column in CODED_COLUMNS:
+            columns[column][start:stop] = np.fromiter(
+                (self._intern(column, getattr(t, column)) for t in transactions),
+                dtype=np.int32,
+                count=count,
+            )
+
+        self._row_index.update(zip(columns["id"][start:stop], range(start, stop)))
+        self._size = stop
+        self._next_seq += count
+        self._derived = {}
+        self.data_version += 1
+
+        if self._date_order is not None:
+            # Merge the new rows into the sorted order; they come after
+            # existing rows with the same date since their seq is larger.
+            timestamps = columns["date_ts"]
+            new_rows = np.arange(start, stop)
+            new_rows = new_rows[np.argsort(-timestamps[new_rows], kind="stable")]
+            positions = np.searchsorted(
+                -timestamps[self._date_order], -timestamps[new_rows], side="right"
+            )
+            self._date_order = np.insert(self._date_order, positions, new_rows)
+
+    def _remove_row(self, transaction_id: str) -> None:
+        """Retirer une transaction du stockage colonnaire.
+        
+        La dernière ligne est déplacée à la place de la ligne retirée (O(1)) ;
+        l'ordre d'insertion reste connu grâce à la colonne ``seq``.
+        
+        Paramètres
+        ----------
+        transaction_id : str
+            L'ID de la transaction à retirer, présente dans le stockage.
+        """
+        row = self._row_index.pop(transaction_id)
+        last = self._size - 1
+        for column, values in self._columns.items():
+            values[row] = values[last]
+            if values.dtype == object:
+                # Release the references held by the vacated slot
+                values[last] = None
+        if row != last:
+            self._row_index[self._columns["id"][row]] = row
+        self._size = last
+        self._derived = {}
+        self.data_version += 1
+
+        if self._date_order is not None:
+            order = self._date_order[self._date_order != row]
+            order[order == last] = row
+            self._date_order = order
+
+    def _get_columns(self) -> Dict[str, np.ndarray]:
+        """Obtenir les colonnes des transactions stockées.
+        
+        Retourne des vues sur les lignes occupées du stockage colonnaire : les
+        tris et filtres se font ainsi sur des tampons contigus de type primitif
+        plutôt que sur des objets Python.
+        
+        Retours
+        -------
+        Dict[str, np.ndarray]
+            Dictionnaire des colonnes indexées par nom.
+        """
+        size = self._size
+        return {column: values[:size] for column, values in self._columns.items()}
+
+    @_synchronized
+    def count(self) -> int:
+        """Obtenir le nombre de transactions du référentiel, en O(1).
+        
+        Retours
+        -------
+        int
+            Nombre de transactions stockées.
+        """
+        return self._size
+
+    @_synchronized
+    def amounts_view(self) -> np.ndarray:
+        """Obtenir les montants de toutes les transactions, sans copie.
+        
+        Retours
+        -------
+        np.ndarray
+            Vue float64 en lecture seule sur la colonne des montants.
+            Une suppression ultérieure la modifie sur place : la lire
+            sous ``lock`` si d'autres threads modifient le référentiel.
+        """
+        view = self._columns["amount"][: self._size]
+        view.flags.writeable = False
+        return view
+
+    @_synchronized
+    def dates_view(self) -> np.ndarray:
+        """Obtenir les dates de toutes les transactions, sans copie.
+        
+        Retours
+        -------
+        np.ndarray
+            Vue datetime64[us] en lecture seule sur la colonne des dates.
+            Une suppression ultérieure la modifie sur place : la lire
+            sous ``lock`` si d'autres threads modifient le référentiel.
+        """
+        view = self._columns["date_ts"][: self._size].view("datetime64[us]")
+        view.flags.writeable = False
+        return view
+
+    @_synchronized
+    def fraud_view(self) -> np.ndarray:
+        """Obtenir l'indicateur de fraude de toutes les transactions, sans copie.
+        
+        Retours
+        -------
+        np.ndarray
+            Vue booléenne en lecture seule sur la colonne ``is_fraud``.
+            Une suppression ultérieure la modifie sur place : la lire
+            sous ``lock`` si d'autres threads modifient le référentiel.
+        """
+        view = self._columns["is_fraud"][: self._size]
+        view.flags.writeable = False
+        return view
+
+    def _group_rows(self, column: str, value: str) -> np.ndarray:
+        """Obtenir les lignes dont une colonne groupée vaut une valeur.
+        
+        Les lignes sont regroupées par code à la manière d'un index CSR : une
+        permutation des lignes triées par code et un tableau de décalages par
+        code, construits à la demande et invalidés à chaque modification. Les
+        lignes d'une valeur forment ainsi une tranche contiguë.
+        
+        Paramètres
+        ----------
+        column : str
+            Nom de la colonne groupée (voir ``GROUPED_COLUMNS``).
+        value : str
+            Valeur recherchée.
+        
+        Retours
+        -------
+        np.ndarray
+            Positions croissantes des lignes correspondantes.
+        """
+        code = self._code_of(column, value)
+        if code < 0:
+            return np.empty(0, dtype=np.int64)
+
+        order, offsets = self._group_index(column)
+        return order[offsets[code]: offsets[code + 1]]
+
+    def _group_index(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Obtenir l'index CSR d'une colonne groupée.
+        
+        Paramètres
+        ----------
+        column : str
+            Nom de la colonne groupée (voir ``GROUPED_COLUMNS``).
+        
+        Retours
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Tuple de (permutation des lignes triées par code, décalages par
+            code). Le nombre de lignes d'un code est ``np.diff(offsets)``.
+        """
+        order_key = f"{column}_order"
+        offsets_key = f"{column}_offsets"
+        derived = self._derived
+        if order_key not in derived:
+            codes = self._get_columns()[column]
+            counts = np.bincount(codes, minlength=len(self._categories[column]))
+            offsets = np.zeros(counts.size + 1, dtype=np.int64)
+            np.cumsum(counts, out=offsets[1:])
+            derived[order_key] = np.argsort(codes, kind="stable")
+            derived[offsets_key] = offsets
+
+        return derived[order_key], derived[offsets_key]
+
+    def _page_by_date(
+        self, rows: Optional[np.ndarray], page: int, limit: int
+    ) -> Tuple[List[Transaction], int]:
+        """Paginer des lignes triées par date décroissante.
+        
+        Sélectionne uniquement les ``offset + limit`` lignes les plus récentes
+        avec ``np.argpartition`` (O(N)) lorsque ce nombre est petit devant le
+        total, puis trie ce sous-ensemble. À date égale, l'ordre d'insertion
+        est conservé, comme avec un tri stable.
+        
+        Paramètres
+        ----------
+        rows : np.ndarray, optionnel
+            Positions des lignes candidates. None pour toutes les lignes.
+        page : int
+            Numéro de page (indexé à partir de 1).
+        limit : int
+            Nombre d'éléments par page.
+        
+        Retours
+        -------
+        Tuple[List[Transaction], int]
+            Tuple de (transactions pour la page, nombre total de candidates).
+        """
+        columns = self._get_columns()
+        timestamps = columns["date_ts"]
+        sequence = columns["seq"]
+        if rows is not None:
+            timestamps = timestamps[rows]
+            sequence = sequence[rows]
+
+        total_count = int(timestamps.size)
+        offset = (page - 1) * limit
+        if offset >= total_count:
+            return [], total_count
+
+        k = min(offset + limit, total_count)
+        if k < total_count // 8:
+            # Threshold of the k-th most recent date; ties at the threshold
+            # are all kept so the page boundaries stay deterministic.
+            kth = np.partition(timestamps, total_count - k)[total_count - k]
+            candidates = np.flatnonzero(timestamps >= kth)
+        else:
+            candidates = np.arange(total_count)
+
+        order = np.lexsort((sequence[candidates], -timestamps[candidates]))
+        selected = candidates[order][offset: offset + limit]
+        if rows is not None:
+            selected = rows[selected]
 
-        if self.min_date is None or transaction.date < self.min_date:
-            self.min_date = transaction.date
-        if self.max_date is None or transaction.date > self.max_date:
-            self.max_date = transaction.date
+        return columns["transaction"][selected].tolist(), total_count
 
+    def _sorted_by_date(self, rows: np.ndarray) -> List[Transaction]:
+        """Trier des lignes par date décroissante.
+        
+        Utilisé pour construire les vues mémorisées par client et par
+        commerçant, que la pagination découpe ensuite directement.
+        
+        Paramètres
+        ----------
+        rows : np.ndarray
+            Positions des lignes à trier.
+        
+        Retours
+        -------
+        List[Transaction]
+            Transactions triées par date décroissante, dans l'ordre
+            d'insertion à date égale.
+        """
+        transactions, _ = self._page_by_date(rows, 1, max(len(rows), 1))
+        return transactions
+
+    @_synchronized
     def get_all_transactions(self) -> List[Transaction]:
         """Obtenir toutes les transactions.
         
@@ -231,12 +1150,32 @@ class TransactionRepository:
         """
         return list(self.transactions.values())
 
+    def _get_date_order(self) -> np.ndarray:
+        """Obtenir les lignes triées par date décroissante.
+        
+        L'ordre est construit à la première demande puis tenu à jour à
+        chaque insertion et suppression.
+        
+        Retours
+        -------
+        np.ndarray
+            Positions de toutes les lignes, par date décroissante puis par
+            ordre d'insertion.
+        """
+        if self._date_order is None:
+            columns = self._get_columns()
+            self._date_order = np.lexsort((columns["seq"], -columns["date_ts"]))
+        return self._date_order
+
+    @_synchronized
     def get_all(
         self, page: int = 1, limit: int = 50
     ) -> Tuple[List[Transaction], int]:
         """Obtenir les transactions paginées.
         
         Récupère toutes les transactions avec pagination, triées par date en ordre décroissant.
+        L'ordre trié est calculé une fois puis maintenu, de sorte qu'une page
+        se réduit à un découpage.
         
         Paramètres
         ----------
@@ -256,15 +1195,10 @@ class TransactionRepository:
             limit = 50
 
         offset = (page - 1) * limit
-        all_transactions = sorted(
-            self.transactions.values(),
-            key=lambda t: t.date,
-            reverse=True,
-        )
-        total_count = len(all_transactions)
-        transactions = all_transactions[offset: offset + limit]
-        return transactions, total_count
+        rows = self._get_date_order()[offset: offset + limit]
+        return self._columns["transaction"][rows].tolist(), self._size
 
+    @_synchronized
     def get_by_id(self, transaction_id: str) -> Optional[Transaction]:
         """Obtenir une transaction par ID.
         
@@ -280,6 +1214,7 @@ class TransactionRepository:
         """
         return self.transactions.get(transaction_id)
 
+    @_synchronized
     def search(
         self, filters: SearchFilters, page: int = 1, limit: int = 50
     ) -> Tuple[List[Transaction], int]:
@@ -307,74 +1242,86 @@ class TransactionRepository:
         if limit < 1 or limit > 1000:
             limit = 50
 
-        # Start with all transactions
-        results = list(self.transactions.values())
-        self.df = pd.DataFrame([vars(t) for t in results])
-        df1 = self.df.copy()
-
-        # Initialize mask for filtering
-        mask = pd.Series([True] * len(df1), index=df1.index)
+        columns = self._get_columns()
+        rows = self._rows_in_amount_range(filters.min_amount, filters.max_amount)
 
-        # Apply filters using mask
-        if filters.client_id and filters.client_id not in ("", "string"):
-            mask &= df1["client_id"] == str(filters.client_id)
-
-        if filters.transaction_id and filters.transaction_id not in (
-            "",
-            "string",
-        ):
-            mask &= df1["id"] == str(filters.transaction_id)
+        shape = tuple(
+            getattr(filters, field) not in (None, "", "string")
+            for field, _, _ in SEARCH_EQUALITY_FILTERS
+        )
+        # Each filter only scans the rows that survived the previous ones,
+        # so temporaries shrink with selectivity instead of staying N-sized.
+        for field, column, categorical in _search_plan(shape):
+            value = str(getattr(filters, field))
+            if column == "id":
+                # Transaction IDs are unique: resolve the row directly
+                row = self._row_index.get(value)
+                hits = np.array([] if row is None else [row], dtype=np.int64)
+                rows = hits if rows is None else np.intersect1d(rows, hits)
+            else:
+                # Categorical values compare int32 codes; unknown ones match
+                # nothing (code -1)
+                target = self._code_of(column, value) if categorical else value
+                values = columns[column] if rows is None else columns[column][rows]
+                hits = np.flatnonzero(values == target)
+                rows = hits if rows is None else rows[hits]
+            if rows.size == 0:
+                break
 
-        if filters.use_chip and filters.use_chip not in ("", "string"):
-            mask &= df1["use_chip"] == str(filters.use_chip)
+        if rows is None:
+            rows = np.arange(columns["id"].size)
 
-        if filters.merchant_city and filters.merchant_city not in (
-            "",
-            "string",
-        ):
-            mask &= df1["merchant_city"] == str(filters.merchant_city)
-        if filters.min_amount is not None:
-            mask &= df1["amount"] >= float(filters.min_amount)
-        if filters.max_amount is not None:
-            mask &= df1["amount"] <= float(filters.max_amount)
-
-        # Apply mask to get filtered results
-        df_filtered = df1[mask]
-        # Convert filtered dataframe back to Transaction objects
-        filtered_results: List[Transaction] = []
-        for _, row in df_filtered.iterrows():
-            transaction = Transaction(
-                id=str(row["id"]),
-                date=row["date"],
-                client_id=str(row["client_id"]),
-                card_id=str(row["card_id"]),
-                amount=float(row["amount"]),
-                use_chip=str(row["use_chip"]),
-                merchant_id=str(row["merchant_id"]),
-                merchant_city=str(row["merchant_city"]),
-                merchant_state=str(row["merchant_state"]),
-                zip=str(row["zip"]),
-                mcc=str(row["mcc"]),
-                errors=row["errors"] if pd.notna(row["errors"]) else None,
-            )
-            filtered_results.append(transaction)
+        # Paginate the matching rows by date without rebuilding them all
+        return self._page_by_date(rows, page, limit)
 
-        # Sort by date descending
-        filtered_results = sorted(
-            filtered_results,
-            key=lambda t: t.date,
-            reverse=True,
-        )
-        df_filtered = None
+    def _rows_in_amount_range(
+        self, min_amount: Optional[float], max_amount: Optional[float]
+    ) -> Optional[np.ndarray]:
+        """Obtenir les lignes dont le montant est dans une plage.
+        
+        Utilise une permutation des montants triés (construite à la demande et
+        invalidée à chaque modification du stockage) et ``np.searchsorted`` pour trouver
+        les bornes en O(log N), au lieu de comparer chaque montant.
+        
+        Paramètres
+        ----------
+        min_amount : float, optionnel
+            Montant minimum inclus.
+        max_amount : float, optionnel
+            Montant maximum inclus.
+        
+        Retours
+        -------
+        np.ndarray, optionnel
+            Positions croissantes des lignes dans la plage, ou None
+            si aucune borne n'est fournie.
+        """
+        if min_amount is None and max_amount is None:
+            return None
 
-        # Apply pagination
-        offset = (page - 1) * limit
-        total_count = len(filtered_results)
-        paginated_results = filtered_results[offset: offset + limit]
+        derived = self._derived
+        if "amount_order" not in derived:
+            amounts = self._get_columns()["amount"]
+            order = np.argsort(amounts, kind="stable")
+            derived["amount_order"] = order
+            derived["amount_sorted"] = amounts[order]
 
-        return paginated_results, total_count
+        sorted_amounts = derived["amount_sorted"]
+        start = 0
+        stop = sorted_amounts.size
+        if min_amount is not None:
+            start = int(
+                np.searchsorted(sorted_amounts, float(min_amount), side="left")
+            )
+        if max_amount is not None:
+            stop = int(
+                np.searchsorted(sorted_amounts, float(max_amount), side="right")
+            )
+        # Back to storage order for sequential gathers
+        return np.sort(derived["amount_order"][start:stop])
 
-    def delete(self, transaction_id: str) -> None:
+    @_synchronized
+    def delete(self, transaction_id: str) -> bool:
         """Supprimer une transaction.
         
         Supprime une transaction du référentiel et de tous les index.
@@ -383,23 +1330,40 @@ class TransactionRepository:
         ----------
         transaction_id : str
             L'ID de la transaction à supprimer.
+        
+        Retours
+        -------
+        bool
+            True si la transaction a été supprimée, False si elle n'existait pas.
         """
-        if transaction_id not in self.transactions:
-            return
-
-        transaction = self.transactions[transaction_id]
+        # A single probe both checks and removes the transaction
+        transaction = self.transactions.pop(transaction_id, None)
+        if transaction is None:
+            return False
 
         # Remove from all indexes
-        del self.transactions[transaction_id]
-        self.customer_index[transaction.client_id].remove(transaction_id)
-        self.merchant_index[transaction.merchant_id].remove(transaction_id)
-        self.type_index[transaction.mcc].remove(transaction_id)
-        self.use_chip_index[transaction.use_chip].remove(transaction_id)
-        self.date_index.remove(transaction_id)
+        self._remove_row(transaction_id)
+        self._customer_views.pop(transaction.client_id, None)
+        self._merchant_views.pop(transaction.merchant_id, None)
+        del self.type_index[transaction.mcc][transaction_id]
+        del self.use_chip_index[transaction.use_chip][transaction_id]
+        del self.date_index[transaction_id]
+        # Reset rather than keep rounding residue once the store is empty
+        if self.transactions:
+            self.total_amount -= transaction.amount
+        else:
+            self.total_amount = 0.0
 
         if transaction.errors:
-            self.fraud_index.remove(transaction_id)
+            del self.fraud_index[transaction_id]
+            # Reset rather than keep rounding residue once no fraud is left
+            if self.fraud_index:
+                self.fraud_amount -= transaction.amount
+            else:
+                self.fraud_amount = 0.0
+        return True
 
+    @_synchronized
     def get_by_customer(
         self, customer_id: str, page: int = 1, limit: int = 50
     ) -> Tuple[List[Transaction], int]:
@@ -426,20 +1390,15 @@ class TransactionRepository:
         if limit < 1 or limit > 1000:
             limit = 50
 
-        transaction_ids = self.customer_index.get(customer_id, [])
-        transactions = [
-            self.transactions[tid]
-            for tid in transaction_ids
-            if tid in self.transactions
-        ]
-        transactions = sorted(transactions, key=lambda t: t.date, reverse=True)
+        view = self._customer_views.get(customer_id)
+        if view is None:
+            view = self._sorted_by_date(self._group_rows("client_id", customer_id))
+            self._customer_views[customer_id] = view
 
         offset = (page - 1) * limit
-        total_count = len(transactions)
-        paginated_transactions = transactions[offset: offset + limit]
-
-        return paginated_transactions, total_count
+        return view[offset: offset + limit], len(view)
 
+    @_synchronized
     def get_by_merchant(
         self, merchant_id: str, page: int = 1, limit: int = 50
     ) -> Tuple[List[Transaction], int]:
@@ -466,24 +1425,15 @@ class TransactionRepository:
         if limit < 1 or limit > 1000:
             limit = 50
 
-        transaction_ids = self.merchant_index.get(merchant_id, [])
-        transactions = [
-            self.transactions[tid]
-            for tid in transaction_ids
-            if tid in self.transactions
-        ]
-        transactions = sorted(
-            transactions,
-            key=lambda t: t.date,
-            reverse=True,
-        )
+        view = self._merchant_views.get(merchant_id)
+        if view is None:
+            view = self._sorted_by_date(self._group_rows("merchant_id", merchant_id))
+            self._merchant_views[merchant_id] = view
 
         offset = (page - 1) * limit
-        total_count = len(transactions)
-        paginated_transactions = transactions[offset: offset + limit]
-
-        return paginated_transactions, total_count
+        return view[offset: offset + limit], len(view)
 
+    @_synchronized
     def get_all_by_type(self, mcc: str) -> List[Transaction]:
         """Obtenir toutes les transactions d'un type spécifique.
         
@@ -499,13 +1449,10 @@ class TransactionRepository:
         List[Transaction]
             Liste des transactions avec le MCC spécifié.
         """
-        transaction_ids = self.type_index.get(mcc, [])
-        return [
-            self.transactions[tid]
-            for tid in transaction_ids
-            if tid in self.transactions
-        ]
+        transaction_ids = self.type_index.get(mcc, {})
+        return [self.transactions[tid] for tid in transaction_ids]
 
+    @_synchronized
     def get_fraud_transactions(self) -> List[Transaction]:
         """Obtenir toutes les transactions frauduleuses.
         
@@ -514,12 +1461,9 @@ class TransactionRepository:
         List[Transaction]
             Liste de toutes les transactions signalées comme frauduleuses.
         """
-        return [
-            self.transactions[tid]
-            for tid in self.fraud_index
-            if tid in self.transactions
-        ]
+        return [self.transactions[tid] for tid in self.fraud_index]
 
+    @_synchronized
     def get_all_types(self) -> List[str]:
         """Obtenir tous les types de transaction uniques.
         
@@ -530,6 +1474,7 @@ class TransactionRepository:
         """
         return list(self.type_index.keys())
 
+    @_synchronized
     def get_all_customers(self) -> List[str]:
         """Obtenir tous les ID client uniques.
         
@@ -538,8 +1483,223 @@ class TransactionRepository:
         List[str]
             Liste de tous les ID client uniques du référentiel.
         """
-        return list(self.customer_index.keys())
+        return list(self._vocabularies["client_id"])
+
+    @property
+    @_synchronized
+    def sorted_customer_ids(self) -> np.ndarray:
+        """ID client uniques triés, mémorisés jusqu'à la prochaine modification."""
+        derived = self._derived
+        if "client_id_sorted" not in derived:
+            derived["client_id_sorted"] = np.sort(
+                np.array(self._categories["client_id"], dtype=object)
+            )
+        return derived["client_id_sorted"]
 
+    @_synchronized
+    def get_top_customers(self, n: int = 10) -> List[Tuple[str, int, float]]:
+        """Obtenir les n clients ayant le plus de transactions.
+        
+        Les nombres de transactions et montants par client viennent de
+        ``_totals_by`` ; seuls les n plus grands sont sélectionnés avec
+        ``np.argpartition`` (O(M)) avant d'être triés, au lieu de trier tous
+        les clients. À nombre égal, l'ordre de première apparition est conservé.
+        
+        Paramètres
+        ----------
+        n : int, optionnel
+            Nombre de clients à retourner. Par défaut 10.
+        
+        Retours
+        -------
+        List[Tuple[str, int, float]]
+            Tuples (ID client, nombre de transactions, montant total) triés par
+            nombre de transactions décroissant. Les clients sans transaction
+            sont exclus.
+        """
+        counts, totals = self._totals_by("client_id")
+        active = int(np.count_nonzero(counts))
+        n = min(n, active)
+        if n <= 0:
+            return []
+
+        if n < counts.size:
+            # Keep every customer tied with the n-th count so the ranking
+            # stays deterministic, then cut after the sort.
+            kth = counts[np.argpartition(counts, counts.size - n)[counts.size - n]]
+            candidates = np.flatnonzero(counts >= kth)
+        else:
+            candidates = np.flatnonzero(counts)
+        ranked = candidates[np.argsort(-counts[candidates], kind="stable")][:n]
+
+        categories = self._categories["client_id"]
+        return [
+            (categories[code], int(counts[code]), float(totals[code]))
+            for code in ranked
+        ]
+
+    def _totals_by(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Obtenir le nombre de transactions et le montant total par valeur.
+        
+        Les deux agrégats sont calculés en une passe chacun par ``np.bincount``
+        (pondéré par les montants pour les totaux) sur les codes de la
+        colonne, sans table de hachage ni boucle Python. Ils sont mémorisés
+        jusqu'à la prochaine modification.
+        
+        Paramètres
+        ----------
+        column : str
+            Nom d'une colonne codée (voir ``CODED_COLUMNS``).
+        
+        Retours
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Tuple de (nombres de transactions, montants totaux) indexés par code.
+        """
+        counts_key = f"{column}_counts"
+        totals_key = f"{column}_totals"
+        derived = self._derived
+        if totals_key not in derived:
+            columns = self._get_columns()
+            codes = columns[column]
+            size = len(self._categories[column])
+            derived[counts_key] = np.bincount(codes, minlength=size)
+            derived[totals_key] = np.bincount(
+                codes, weights=columns["amount"], minlength=size
+            )
+        return derived[counts_key], derived[totals_key]
+
+    @_synchronized
+    def get_totals_by_type(self) -> List[Tuple[str, int, float]]:
+        """Obtenir le nombre de transactions et le montant total par type.
+        
+        Retours
+        -------
+        List[Tuple[str, int, float]]
+            Tuples (code de catégorie de commerçant, nombre de transactions,
+            montant total), triés par nombre décroissant ; à égalité, dans
+            l'ordre de première apparition des types. Les types sans
+            transaction sont exclus.
+        """
+        counts, totals = self._totals_by("mcc")
+        categories = self._categories["mcc"]
+        present = np.flatnonzero(counts)
+        # Stable argsort on the negated counts keeps ties in code order
+        present = present[np.argsort(-counts[present], kind="stable")]
+        return list(
+            zip(
+                [categories[code] for code in present],
+                counts[present].tolist(),
+                totals[present].tolist(),
+            )
+        )
+
+    @_synchronized
+    def get_daily_totals(self) -> List[Tuple[str, int, float]]:
+        """Obtenir le nombre de transactions et le montant total par jour.
+        
+        Les lignes sont parcourues dans l'ordre par date maintenu par le
+        référentiel : les jours forment des plages contiguës, repérées par
+        ``np.diff`` sur les horodatages ramenés au jour, et les montants sont
+        sommés par plage avec ``np.add.reduceat``, sans tri ni hachage.
+        Aucun objet ``datetime`` n'est créé par transaction. Le résultat est
+        mémorisé jusqu'à la prochaine modification.
+        
+        Retours
+        -------
+        List[Tuple[str, int, float]]
+            Tuples (date ISO, nombre de transactions, montant total), triés par
+            date croissante.
+        """
+        derived = self._derived
+        if self._size == 0:
+            return []
+        if "daily_totals" not in derived:
+            columns = self._get_columns()
+            # The maintained order is by date descending: reverse it
+            rows = self._get_date_order()[::-1]
+            days = columns["date_ts"][rows] // MICROSECONDS_PER_DAY
+            starts = np.flatnonzero(np.diff(days, prepend=days[0] - 1))
+            counts = np.diff(starts, append=days.size)
+            totals = np.add.reduceat(columns["amount"][rows], starts)
+            derived["daily_totals"] = list(
+                zip(
+                    days[starts].astype("datetime64[D]").astype(str).tolist(),
+                    counts.tolist(),
+                    totals.tolist(),
+                )
+            )
+        return list(derived["daily_totals"])
+
+    @_synchronized
+    def count_by_customer(self, customer_id: str) -> int:
+        """Obtenir le nombre de transactions d'un client.
+        
+        Paramètres
+        ----------
+        customer_id : str
+            L'ID du client.
+        
+        Retours
+        -------
+        int
+            Nombre de transactions du client, 0 s'il est inconnu.
+        """
+        code = self._code_of("client_id", customer_id)
+        if code < 0:
+            return 0
+        counts, _ = self._totals_by("client_id")
+        return int(counts[code])
+
+    @_synchronized
+    def get_counts_by_customers(self, customer_ids: List[str]) -> Dict[str, int]:
+        """Obtenir le nombre de transactions de plusieurs clients en un appel.
+        
+        Les codes des clients sont résolus puis les nombres lus en une seule
+        indexation du tableau des nombres par client.
+        
+        Paramètres
+        ----------
+        customer_ids : List[str]
+            Les ID des clients.
+        
+        Retours
+        -------
+        Dict[str, int]
+            Nombre de transactions par ID client, 0 pour les clients inconnus.
+        """
+        vocabulary = self._vocabularies["client_id"]
+        codes = np.fromiter(
+            (vocabulary.get(cid, -1) for cid in customer_ids),
+            dtype=np.int64,
+            count=len(customer_ids),
+        )
+        counts, _ = self._totals_by("client_id")
+        # Unknown customers (code -1) read a padding zero
+        found = np.append(counts, 0)[codes]
+        return dict(zip(customer_ids, found.tolist()))
+
+    @_synchronized
+    def sum_amount_by_customer(self, customer_id: str) -> float:
+        """Obtenir le montant total des transactions d'un client.
+        
+        Paramètres
+        ----------
+        customer_id : str
+            L'ID du client.
+        
+        Retours
+        -------
+        float
+            Somme des montants du client, 0.0 s'il est inconnu.
+        """
+        code = self._code_of("client_id", customer_id)
+        if code < 0:
+            return 0.0
+        _, totals = self._totals_by("client_id")
+        return float(totals[code])
+
+    @_synchronized
     def get_all_use_chip_types(self) -> List[str]:
         """Obtenir tous les types use_chip uniques.
         
@@ -550,6 +1710,56 @@ class TransactionRepository:
         """
         return list(self.use_chip_index.keys())
 
+    @_synchronized
+    def get_use_chip_counts(self) -> Dict[str, int]:
+        """Obtenir le nombre de transactions de chaque type use_chip.
+        
+        Les nombres sont lus dans la taille des entrées de ``use_chip_index``,
+        tenu à jour à chaque insertion et suppression : O(K) pour K types, sans
+        parcourir les transactions.
+        
+        Retours
+        -------
+        Dict[str, int]
+            Nombre de transactions par type use_chip.
+        """
+        return {
+            use_chip: len(transaction_ids)
+            for use_chip, transaction_ids in self.use_chip_index.items()
+        }
+
+    @_synchronized
+    def get_fraud_counts_by_use_chip(self) -> Dict[str, int]:
+        """Obtenir le nombre de transactions frauduleuses de chaque type use_chip.
+        
+        Un seul ``np.bincount`` sur les codes use_chip des lignes marquées
+        par la colonne booléenne ``is_fraud``, au lieu d'un parcours des
+        transactions de chaque type. Le résultat est mémorisé jusqu'à la
+        prochaine modification.
+        
+        Retours
+        -------
+        Dict[str, int]
+            Nombre de fraudes par type use_chip ; les types sans fraude sont
+            absents.
+        """
+        derived = self._derived
+        if "use_chip_fraud_counts" not in derived:
+            columns = self._get_columns()
+            counts = np.bincount(
+                columns["use_chip"][columns["is_fraud"]],
+                minlength=len(self._categories["use_chip"]),
+            )
+            categories = self._categories["use_chip"]
+            derived["use_chip_fraud_counts"] = {
+                categories[code]: count
+                for code, count in zip(
+                    np.flatnonzero(counts).tolist(), counts[counts > 0].tolist()
+                )
+            }
+        return dict(derived["use_chip_fraud_counts"])
+
+    @_synchronized
     def get_all_by_use_chip(self, use_chip: str) -> List[Transaction]:
         """Obtenir toutes les transactions d'un type use_chip spécifique.
         
@@ -565,9 +1775,5 @@ class TransactionRepository:
         List[Transaction]
             Liste des transactions avec le type use_chip spécifié.
         """
-        transaction_ids = self.use_chip_index.get(use_chip, [])
-        return [
-            self.transactions[tid]
-            for tid in transaction_ids
-            if tid in self.transactions
-        ]
+        transaction_ids = self.use_chip_index.get(use_chip, {})
+        return [self.transactions[tid] for tid in transaction_ids]
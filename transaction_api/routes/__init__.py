@@ -1,7 +1,8 @@
 """Package des routes de l'API.
 
-Ce package contient tous les routeurs qui définissent les points de terminaison (endpoints)
-de l'API, organisés par domaine fonctionnel (transactions, clients, fraude, statistiques, système).
+Ce package contient tous les routeurs qui définissent les points de terminaison
+(endpoints) de l'API, organisés par domaine fonctionnel (transactions, clients,
+fraude, statistiques, système, tableau de bord).
 
 Modules
 -------
@@ -15,4 +16,6 @@ statistics_routes
     Routes pour les statistiques.
 system_routes
     Routes pour les opérations système.
+dashboard_routes
+    Route composite du tableau de bord.
 """
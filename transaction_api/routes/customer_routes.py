@@ -7,8 +7,8 @@ et l'identification des meilleurs clients.
 Fonctions
 ---------
 get_service()
-    Obtenir une instance du service client.
-get_all_customers(page, limit)
+    Dépendance FastAPI fournissant le service client partagé.
+get_all_customers(page, limit, cursor)
     Récupérer tous les clients avec pagination.
 get_customer_details(customer_id)
     Récupérer les détails d'un client spécifique.
@@ -16,8 +16,13 @@ get_top_customers(n)
     Récupérer les n meilleurs clients.
 """
 
+import asyncio
+from functools import lru_cache
+from typing import Optional
+
 from fastapi import (
     APIRouter,
+    Depends,
     HTTPException,
     Query,
     status,
@@ -31,6 +36,7 @@ from transaction_api.models import (
     PaginatedResponse,
     TopCustomer,
 )
+from transaction_api.repository import TransactionRepository
 from transaction_api.services.customer_service import CustomerService
 
 logger = get_logger(__name__)
@@ -38,8 +44,29 @@ logger = get_logger(__name__)
 router: APIRouter = APIRouter(prefix="/api/customers", tags=["customers"])
 
 
+@lru_cache(maxsize=1)
+def _service_for(repository: TransactionRepository) -> CustomerService:
+    """Construire le service client pour un référentiel donné.
+    
+    Le service est mis en cache par instance de référentiel : il est
+    réutilisé d'une requête à l'autre et reconstruit seulement lorsque
+    ``app_context.repository`` est remplacé.
+    
+    Paramètres
+    ----------
+    repository : TransactionRepository
+        Le référentiel de transactions pour accéder aux données.
+    
+    Retours
+    -------
+    CustomerService
+        Instance partagée du service client.
+    """
+    return CustomerService(repository)
+
+
 def get_service() -> CustomerService:
-    """Obtenir une instance du service client.
+    """Dépendance FastAPI fournissant le service client partagé.
     
     Retours
     -------
@@ -56,72 +83,61 @@ def get_service() -> CustomerService:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Repository not initialized",
         )
-    return CustomerService(app_context.repository)
+    return _service_for(app_context.repository)
 
 
 @router.get("", response_model=PaginatedResponse[CustomerSummary])
 async def get_all_customers(
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=1000),
+    cursor: Optional[str] = Query(
+        None, description="Last customer ID of the previous page"
+    ),
+    service: CustomerService = Depends(get_service),
 ) -> PaginatedResponse[CustomerSummary]:
     """Récupérer tous les clients avec pagination.
     
     Paramètres
     ----------
     page : int
-        Numéro de page (indexé à partir de 1).
+        Numéro de page (indexé à partir de 1), ignoré si un curseur est fourni.
     limit : int
         Nombre d'éléments par page.
+    cursor : str, optionnel
+        ``next_cursor`` de la page précédente.
+    service : CustomerService
+        Service client injecté par FastAPI.
     
     Retours
     -------
     PaginatedResponse[CustomerSummary]
         Réponse paginée contenant les résumés des clients.
-    
-    Lève
-    ----
-    HTTPException
-        En cas d'erreur lors de la récupération.
     """
-    try:
-        service = get_service()
-        return service.get_all_customers(page=page, limit=limit)
-    except Exception as e:
-        logger.error(f"Error getting customers: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving customers",
-        )
+    return await asyncio.to_thread(
+        service.get_all_customers, page=page, limit=limit, cursor=cursor
+    )
 
 
 @router.get("/{customer_id}", response_model=Customer)
-async def get_customer_details(customer_id: str) -> Customer:
+async def get_customer_details(
+    customer_id: str,
+    service: CustomerService = Depends(get_service),
+) -> Customer:
     """Récupérer les détails d'un client spécifique.
     
     Paramètres
     ----------
     customer_id : str
         L'identifiant unique du client.
+    service : CustomerService
+        Service client injecté par FastAPI.
     
     Retours
     -------
     Customer
         Objet contenant les détails du client.
-    
-    Lève
-    ----
-    HTTPException
-        En cas d'erreur lors de la récupération.
     """
-    try:
-        service = get_service()
-        return service.get_customer_details(customer_id)
-    except Exception as e:
-        logger.error(f"Error getting customer details: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving customer details",
-        )
+    return await asyncio.to_thread(service.get_customer_details, customer_id)
 
 
 @router.get("/Ranked/top", response_model=list[TopCustomer])
@@ -132,6 +148,7 @@ async def get_top_customers(
         le=1000,
         description="Number of top customers",
     ),
+    service: CustomerService = Depends(get_service),
 ) -> list[TopCustomer]:
     """Récupérer les n meilleurs clients par nombre de transactions.
     
@@ -139,23 +156,12 @@ async def get_top_customers(
     ----------
     n : int
         Nombre de meilleurs clients à retourner.
+    service : CustomerService
+        Service client injecté par FastAPI.
     
     Retours
     -------
     list[TopCustomer]
         Liste des n meilleurs clients.
-    
-    Lève
-    ----
-    HTTPException
-        En cas d'erreur lors de la récupération.
     """
-    try:
-        service = get_service()
-        return service.get_top_customers(n=n)
-    except Exception as e:
-        logger.error(f"Error getting top customers: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving top customers",
-        )
+    return await asyncio.to_thread(service.get_top_customers, n=n)
@@ -0,0 +1,66 @@
+"""Routes de l'API du tableau de bord.
+
+Ce module définit le point de terminaison (endpoint) composite du tableau de bord,
+qui regroupe en une seule requête les statistiques et le résumé de fraude.
+
+Fonctions
+---------
+get_dashboard(stats_service, fraud_service)
+    Récupérer l'ensemble des agrégats du tableau de bord.
+"""
+
+import asyncio
+
+from fastapi import APIRouter, Depends
+
+from transaction_api.cache import ttl_cache
+from transaction_api.logging_config import get_logger
+from transaction_api.models import DashboardStats
+from transaction_api.routes import fraud_routes, statistics_routes
+from transaction_api.services.fraud_service import FraudService
+from transaction_api.services.statistics_service import StatisticsService
+
+logger = get_logger(__name__)
+
+router: APIRouter = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
+
+
+@router.get("", response_model=DashboardStats)
+@ttl_cache()
+async def get_dashboard(
+    stats_service: StatisticsService = Depends(statistics_routes.get_service),
+    fraud_service: FraudService = Depends(fraud_routes.get_service),
+) -> DashboardStats:
+    """Récupérer l'ensemble des agrégats du tableau de bord.
+    
+    Les agrégats sont indépendants : ils sont calculés en parallèle dans le
+    pool de threads, ce qui épargne au client cinq allers-retours HTTP.
+    
+    Paramètres
+    ----------
+    stats_service : StatisticsService
+        Service de statistiques injecté par FastAPI.
+    fraud_service : FraudService
+        Service de fraude injecté par FastAPI.
+    
+    Retours
+    -------
+    DashboardStats
+        Statistiques générales, distribution des montants, statistiques par
+        type et par jour, et résumé de fraude.
+    """
+    overview, distribution, by_type, daily, fraud = await asyncio.gather(
+        asyncio.to_thread(stats_service.get_overview_stats),
+        asyncio.to_thread(stats_service.get_amount_distribution),
+        asyncio.to_thread(stats_service.get_stats_by_type),
+        asyncio.to_thread(stats_service.get_daily_stats),
+        asyncio.to_thread(fraud_service.get_fraud_summary),
+    )
+
+    return DashboardStats(
+        overview=overview,
+        amount_distribution=distribution,
+        stats_by_type=by_type,
+        daily_stats=daily,
+        fraud_summary=fraud,
+    )
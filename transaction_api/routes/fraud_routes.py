@@ -7,18 +7,26 @@ la prédiction de fraude.
 Fonctions
 ---------
 get_service()
-    Obtenir une instance du service de fraude.
+    Dépendance FastAPI fournissant le service de fraude partagé.
 get_fraud_summary()
     Récupérer le résumé de la détection de fraude.
 get_fraud_by_type()
     Récupérer les statistiques de fraude par type.
 predict_fraud(transaction)
     Prédire le risque de fraude pour une transaction.
+predict_fraud_batch(transactions)
+    Prédire le risque de fraude pour un lot de transactions.
 """
 
-from fastapi import APIRouter, HTTPException, status
+import asyncio
+from functools import lru_cache
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends, HTTPException, status
 
 from transaction_api import app_context
+from transaction_api.cache import ttl_cache
+from transaction_api.config import MAX_LIMIT
 from transaction_api.logging_config import get_logger
 from transaction_api.models import (
     FraudPrediction,
@@ -26,6 +34,7 @@ from transaction_api.models import (
     FraudTypeStats,
     Transaction,
 )
+from transaction_api.repository import TransactionRepository
 from transaction_api.services.fraud_service import FraudService
 
 logger = get_logger(__name__)
@@ -33,8 +42,29 @@ logger = get_logger(__name__)
 router: APIRouter = APIRouter(prefix="/api/fraud", tags=["fraud"])
 
 
+@lru_cache(maxsize=1)
+def _service_for(repository: TransactionRepository) -> FraudService:
+    """Construire le service de fraude pour un référentiel donné.
+    
+    Le service est mis en cache par instance de référentiel : il est
+    réutilisé d'une requête à l'autre et reconstruit seulement lorsque
+    ``app_context.repository`` est remplacé.
+    
+    Paramètres
+    ----------
+    repository : TransactionRepository
+        Le référentiel de transactions pour accéder aux données.
+    
+    Retours
+    -------
+    FraudService
+        Instance partagée du service de fraude.
+    """
+    return FraudService(repository)
+
+
 def get_service() -> FraudService:
-    """Obtenir une instance du service de fraude.
+    """Dépendance FastAPI fournissant le service de fraude partagé.
     
     Retours
     -------
@@ -51,82 +81,91 @@ def get_service() -> FraudService:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Repository not initialized",
         )
-    return FraudService(app_context.repository)
+    return _service_for(app_context.repository)
 
 @router.get("/summary", response_model=FraudSummary)
-async def get_fraud_summary() -> FraudSummary:
+@ttl_cache()
+async def get_fraud_summary(
+    service: FraudService = Depends(get_service),
+) -> FraudSummary:
     """Récupérer le résumé de la détection de fraude.
     
+    Paramètres
+    ----------
+    service : FraudService
+        Service de fraude injecté par FastAPI.
+    
     Retours
     -------
     FraudSummary
         Résumé contenant les statistiques de fraude.
-    
-    Lève
-    ----
-    HTTPException
-        En cas d'erreur lors de la récupération.
     """
-    try:
-        service = get_service()
-        return service.get_fraud_summary()
-    except Exception as e:
-        logger.error(f"Error getting fraud summary: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving fraud summary",
-        )
+    return await asyncio.to_thread(service.get_fraud_summary)
 
 @router.get("/by-type", response_model=list[FraudTypeStats])
-async def get_fraud_by_type() -> list[FraudTypeStats]:
+@ttl_cache()
+async def get_fraud_by_type(
+    service: FraudService = Depends(get_service),
+) -> list[FraudTypeStats]:
     """Récupérer les statistiques de fraude groupées par type de transaction.
     
+    Paramètres
+    ----------
+    service : FraudService
+        Service de fraude injecté par FastAPI.
+    
     Retours
     -------
     list[FraudTypeStats]
         Liste des statistiques de fraude par type de transaction.
-    
-    Lève
-    ----
-    HTTPException
-        En cas d'erreur lors de la récupération.
     """
-    try:
-        service = get_service()
-        return service.get_fraud_by_type()
-    except Exception as e:
-        logger.error(f"Error getting fraud by use_chip type: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving fraud statistics by use_chip type",
-        )
+    return await asyncio.to_thread(service.get_fraud_by_type)
 
 
 @router.post("/predict", response_model=FraudPrediction)
-async def predict_fraud(transaction: Transaction) -> FraudPrediction:
+async def predict_fraud(
+    transaction: Transaction,
+    service: FraudService = Depends(get_service),
+) -> FraudPrediction:
     """Prédire le risque de fraude pour une transaction.
     
     Paramètres
     ----------
     transaction : Transaction
         La transaction à analyser.
+    service : FraudService
+        Service de fraude injecté par FastAPI.
     
     Retours
     -------
     FraudPrediction
         Prédiction contenant le score de fraude et le raisonnement.
+    """
+    return service.predict_fraud(transaction)
+
+
+@router.post("/predict/batch", response_model=list[FraudPrediction])
+async def predict_fraud_batch(
+    transactions: Annotated[
+        list[Transaction], Body(min_length=1, max_length=MAX_LIMIT)
+    ],
+    service: FraudService = Depends(get_service),
+) -> list[FraudPrediction]:
+    """Prédire le risque de fraude pour un lot de transactions.
     
-    Lève
-    ----
-    HTTPException
-        En cas d'erreur lors de la prédiction.
+    Un seul appel HTTP remplace un appel par transaction, et les scores sont
+    calculés en une passe vectorisée.
+    
+    Paramètres
+    ----------
+    transactions : list[Transaction]
+        Les transactions à analyser (au plus ``MAX_LIMIT``).
+    service : FraudService
+        Service de fraude injecté par FastAPI.
+    
+    Retours
+    -------
+    list[FraudPrediction]
+        Une prédiction par transaction, dans l'ordre de la requête.
     """
-    try:
-        service = get_service()
-        return service.predict_fraud(transaction)
-    except Exception as e:
-        logger.error(f"Error predicting fraud: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error predicting fraud",
-        )
+    return await asyncio.to_thread(service.predict_fraud_batch, transactions)
@@ -7,35 +7,112 @@ les statistiques par type et les statistiques quotidiennes.
 Fonctions
 ---------
 get_service()
-    Obtenir une instance du service de statistiques.
+    Dépendance FastAPI fournissant le service de statistiques partagé.
 get_overview_stats()
     Récupérer les statistiques générales.
 get_amount_distribution()
     Récupérer la distribution des montants.
-get_stats_by_type()
+get_stats_by_type(layout)
     Récupérer les statistiques par type de transaction.
-get_daily_stats()
+get_daily_stats(layout)
     Récupérer les statistiques quotidiennes.
 """
 
-from fastapi import APIRouter, HTTPException, status
+import asyncio
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List
+
+import orjson
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from transaction_api import app_context
+from transaction_api.cache import ttl_cache
 from transaction_api.logging_config import get_logger
 from transaction_api.models import (
     AmountDistribution,
+    DailyStats,
     OverviewStats,
     TypeStats,
 )
+from transaction_api.repository import TransactionRepository
 from transaction_api.services.statistics_service import StatisticsService
 
 logger = get_logger(__name__)
 
 router: APIRouter = APIRouter(prefix="/api/stats", tags=["statistics"])
 
+LAYOUT_QUERY = Query(
+    "records",
+    alias="format",
+    pattern="^(records|columns|ndjson)$",
+    description=(
+        "'records' for a list of objects, 'columns' for one list per field, "
+        "'ndjson' to stream one JSON object per line"
+    ),
+)
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _to_columns(rows: List[dict], fields: Iterable[str]) -> Dict[str, list]:
+    """Transposer des lignes en colonnes.
+    
+    Paramètres
+    ----------
+    rows : List[dict]
+        Lignes à transposer.
+    fields : Iterable[str]
+        Noms des champs, dans l'ordre des colonnes.
+    
+    Retours
+    -------
+    Dict[str, list]
+        Une liste de valeurs par champ.
+    """
+    return {field: [row[field] for row in rows] for field in fields}
+
+
+def _ndjson_stream(rows: Iterable[dict]) -> Iterator[bytes]:
+    """Encoder des lignes en JSON délimité par des retours à la ligne.
+    
+    Paramètres
+    ----------
+    rows : Iterable[dict]
+        Lignes à encoder, consommées une à une.
+    
+    Retours
+    -------
+    Iterator[bytes]
+        Une ligne JSON encodée par orjson pour chaque ligne d'entrée.
+    """
+    for row in rows:
+        yield orjson.dumps(row) + b"\n"
+
+
+@lru_cache(maxsize=1)
+def _service_for(repository: TransactionRepository) -> StatisticsService:
+    """Construire le service de statistiques pour un référentiel donné.
+    
+    Le service est mis en cache par instance de référentiel : il est
+    réutilisé d'une requête à l'autre et reconstruit seulement lorsque
+    ``app_context.repository`` est remplacé.
+    
+    Paramètres
+    ----------
+    repository : TransactionRepository
+        Le référentiel de transactions pour accéder aux données.
+    
+    Retours
+    -------
+    StatisticsService
+        Instance partagée du service de statistiques.
+    """
+    return StatisticsService(repository)
+
 
 def get_service() -> StatisticsService:
-    """Obtenir une instance du service de statistiques.
+    """Dépendance FastAPI fournissant le service de statistiques partagé.
     
     Retours
     -------
@@ -52,104 +129,111 @@ def get_service() -> StatisticsService:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Repository not initialized",
         )
-    return StatisticsService(app_context.repository)
+    return _service_for(app_context.repository)
 
 
 @router.get("/overview", response_model=OverviewStats)
-async def get_overview_stats() -> OverviewStats:
+@ttl_cache()
+async def get_overview_stats(
+    service: StatisticsService = Depends(get_service),
+) -> OverviewStats:
     """Récupérer les statistiques générales.
     
+    Paramètres
+    ----------
+    service : StatisticsService
+        Service de statistiques injecté par FastAPI.
+    
     Retours
     -------
     OverviewStats
         Objet contenant les statistiques générales.
-    
-    Lève
-    ----
-    HTTPException
-        En cas d'erreur lors de la récupération.
     """
-    try:
-        service = get_service()
-        return service.get_overview_stats()
-    except Exception as e:
-        logger.error(f"Error getting overview stats: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving overview statistics",
-        )
+    return await asyncio.to_thread(service.get_overview_stats)
 
 
 @router.get("/amount-distribution", response_model=AmountDistribution)
-async def get_amount_distribution() -> AmountDistribution:
+@ttl_cache()
+async def get_amount_distribution(
+    service: StatisticsService = Depends(get_service),
+) -> ORJSONResponse:
     """Récupérer les statistiques de distribution des montants.
     
+    Paramètres
+    ----------
+    service : StatisticsService
+        Service de statistiques injecté par FastAPI.
+    
     Retours
     -------
-    AmountDistribution
-        Objet contenant la distribution des montants par plages.
-    
-    Lève
-    ----
-    HTTPException
-        En cas d'erreur lors de la récupération.
+    ORJSONResponse
+        Distribution des montants par plages (``AmountDistribution``), encodée
+        directement sans seconde validation par ``response_model``.
     """
-    try:
-        service = get_service()
-        return service.get_amount_distribution()
-    except Exception as e:
-        logger.error(f"Error getting amount distribution: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving amount distribution",
-        )
+    distribution = await asyncio.to_thread(service.get_amount_distribution)
+    return ORJSONResponse(distribution.model_dump())
 
 
 @router.get("/by-type", response_model=list[TypeStats])
-async def get_stats_by_type() -> list[TypeStats]:
+@ttl_cache()
+async def get_stats_by_type(
+    layout: str = LAYOUT_QUERY,
+    service: StatisticsService = Depends(get_service),
+) -> Response:
     """Récupérer les statistiques groupées par type de transaction.
     
+    Paramètres
+    ----------
+    layout : str
+        Forme de la réponse (paramètre ``format``) : ``records`` pour une liste
+        d'objets, ``columns`` pour un objet contenant une liste par champ,
+        plus compact pour les clients qui consomment des colonnes, ou
+        ``ndjson`` pour un flux d'un objet JSON par ligne.
+    service : StatisticsService
+        Service de statistiques injecté par FastAPI.
+    
     Retours
     -------
-    list[TypeStats]
-        Liste des statistiques par type de transaction.
-    
-    Lève
-    ----
-    HTTPException
-        En cas d'erreur lors de la récupération.
+    Response
+        Liste des statistiques par type de transaction (``TypeStats``),
+        encodée directement sans seconde validation par ``response_model``.
     """
-    try:
-        service = get_service()
-        return service.get_stats_by_type()
-    except Exception as e:
-        logger.error(f"Error getting stats by type: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving statistics by type",
-        )
+    type_stats = await asyncio.to_thread(service.get_stats_by_type)
+    rows = [stats.model_dump() for stats in type_stats]
+    if layout == "columns":
+        return ORJSONResponse(_to_columns(rows, TypeStats.model_fields))
+    if layout == "ndjson":
+        return StreamingResponse(_ndjson_stream(rows), media_type=NDJSON_MEDIA_TYPE)
+    return ORJSONResponse(rows)
 
 
 @router.get("/daily", response_model=list[dict])
-async def get_daily_stats() -> list[dict]:
+@ttl_cache()
+async def get_daily_stats(
+    layout: str = LAYOUT_QUERY,
+    service: StatisticsService = Depends(get_service),
+) -> Response:
     """Récupérer les statistiques quotidiennes groupées par date.
     
+    Paramètres
+    ----------
+    layout : str
+        Forme de la réponse (paramètre ``format``) : ``records``, ``columns``
+        ou ``ndjson``. En ``ndjson``, les jours sont produits et encodés au fil
+        de l'envoi, sans construire la liste complète.
+    service : StatisticsService
+        Service de statistiques injecté par FastAPI.
+    
     Retours
     -------
-    list[dict]
-        Liste des statistiques quotidiennes.
-    
-    Lève
-    ----
-    HTTPException
-        En cas d'erreur lors de la récupération.
+    Response
+        Liste des statistiques quotidiennes, encodée directement.
     """
-    try:
-        service = get_service()
-        return service.get_daily_stats()
-    except Exception as e:
-        logger.error(f"Error getting daily stats: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving daily statistics",
+    if layout == "ndjson":
+        return StreamingResponse(
+            _ndjson_stream(service.iter_daily_stats()), media_type=NDJSON_MEDIA_TYPE
         )
+    rows = await asyncio.to_thread(service.get_daily_stats)
+    if layout == "columns":
+        return ORJSONResponse(_to_columns(rows, DailyStats.model_fields))
+    return ORJSONResponse(rows)
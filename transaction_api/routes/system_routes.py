@@ -6,18 +6,23 @@ système, y compris les vérifications de santé et la récupération des métad
 Fonctions
 ---------
 get_service()
-    Obtenir une instance du service de santé.
+    Dépendance FastAPI fournissant le service de santé partagé.
 get_health_status()
     Récupérer l'état de santé du système.
 get_system_metadata()
     Récupérer les métadonnées du système.
 """
 
-from fastapi import APIRouter, HTTPException, status
+import asyncio
+from functools import lru_cache
+
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from transaction_api import app_context
+from transaction_api.cache import ttl_cache
 from transaction_api.logging_config import get_logger
 from transaction_api.models import HealthStatus, SystemMetadata
+from transaction_api.repository import TransactionRepository
 from transaction_api.services.health_service import HealthService
 
 logger = get_logger(__name__)
@@ -25,8 +30,29 @@ logger = get_logger(__name__)
 router: APIRouter = APIRouter(prefix="/api/system", tags=["system"])
 
 
+@lru_cache(maxsize=1)
+def _service_for(repository: TransactionRepository) -> HealthService:
+    """Construire le service de santé pour un référentiel donné.
+    
+    Le service est mis en cache par instance de référentiel : il est
+    réutilisé d'une requête à l'autre et reconstruit seulement lorsque
+    ``app_context.repository`` est remplacé.
+    
+    Paramètres
+    ----------
+    repository : TransactionRepository
+        Le référentiel de transactions pour accéder aux données.
+    
+    Retours
+    -------
+    HealthService
+        Instance partagée du service de santé.
+    """
+    return HealthService(repository)
+
+
 def get_service() -> HealthService:
-    """Obtenir une instance du service de santé.
+    """Dépendance FastAPI fournissant le service de santé partagé.
     
     Retours
     -------
@@ -43,54 +69,43 @@ def get_service() -> HealthService:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Repository not initialized",
         )
-    return HealthService(app_context.repository)
+    return _service_for(app_context.repository)
 
 
 @router.get("/health", response_model=HealthStatus)
-async def get_health_status() -> HealthStatus:
+async def get_health_status(
+    service: HealthService = Depends(get_service),
+) -> HealthStatus:
     """Récupérer l'état de santé du système.
     
+    Paramètres
+    ----------
+    service : HealthService
+        Service de santé injecté par FastAPI.
+    
     Retours
     -------
     HealthStatus
         Objet contenant l'état de santé et le temps de réponse.
-    
-    Lève
-    ----
-    HTTPException
-        En cas d'erreur lors de la vérification.
     """
-    try:
-        service = get_service()
-        return service.check_health()
-    except Exception as e:
-        logger.error(f"Error checking health: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error checking system health",
-        )
+    return service.check_health()
 
 
 @router.get("/metadata", response_model=SystemMetadata)
-async def get_system_metadata() -> SystemMetadata:
+@ttl_cache()
+async def get_system_metadata(
+    service: HealthService = Depends(get_service),
+) -> SystemMetadata:
     """Récupérer les métadonnées du système.
     
+    Paramètres
+    ----------
+    service : HealthService
+        Service de santé injecté par FastAPI.
+    
     Retours
     -------
     SystemMetadata
         Objet contenant les métadonnées du système.
-    
-    Lève
-    ----
-    HTTPException
-        En cas d'erreur lors de la récupération.
     """
-    try:
-        service = get_service()
-        return service.get_metadata()
-    except Exception as e:
-        logger.error(f"Error getting metadata: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving system metadata",
-        )
+    return await asyncio.to_thread(service.get_metadata)
@@ -7,7 +7,7 @@ des transactions.
 Fonctions
 ---------
 get_service()
-    Obtenir une instance du service de transactions.
+    Dépendance FastAPI fournissant le service de transactions partagé.
 get_all_transactions(page, limit)
     Récupérer toutes les transactions avec pagination.
 get_transaction(transaction_id)
@@ -26,19 +26,18 @@ get_merchant_transactions(customer_id, page, limit)
     Récupérer les transactions d'un commerçant.
 """
 
+import asyncio
+from functools import lru_cache
+
 from fastapi import (
     APIRouter,
+    Depends,
     HTTPException,
     Query,
     status,
 )
 
 from transaction_api import app_context
-from transaction_api.exceptions import (
-    InvalidPaginationParameters,
-    TransactionNotFound,
-)
-
 from transaction_api.logging_config import get_logger
 from transaction_api.models import (
     PaginatedResponse,
@@ -46,6 +45,7 @@ from transaction_api.models import (
     Transaction,
 )
 
+from transaction_api.repository import TransactionRepository
 from transaction_api.services.transaction_service import TransactionService
 
 logger = get_logger(__name__)
@@ -53,8 +53,29 @@ logger = get_logger(__name__)
 router: APIRouter = APIRouter(prefix="/api/transaction", tags=["transactions"])
 
 
+@lru_cache(maxsize=1)
+def _service_for(repository: TransactionRepository) -> TransactionService:
+    """Construire le service de transactions pour un référentiel donné.
+    
+    Le service est mis en cache par instance de référentiel : il est
+    réutilisé d'une requête à l'autre et reconstruit seulement lorsque
+    ``app_context.repository`` est remplacé.
+    
+    Paramètres
+    ----------
+    repository : TransactionRepository
+        Le référentiel de transactions pour accéder aux données.
+    
+    Retours
+    -------
+    TransactionService
+        Instance partagée du service de transactions.
+    """
+    return TransactionService(repository)
+
+
 def get_service() -> TransactionService:
-    """Obtenir une instance du service de transactions.
+    """Dépendance FastAPI fournissant le service de transactions partagé.
     
     Retours
     -------
@@ -71,12 +92,13 @@ def get_service() -> TransactionService:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Repository not initialized",
         )
-    return TransactionService(app_context.repository)
+    return _service_for(app_context.repository)
 
 @router.get("", response_model=PaginatedResponse[Transaction])
 async def get_all_transactions(
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=1000),
+    service: TransactionService = Depends(get_service),
 ) -> PaginatedResponse[Transaction]:
     """Récupérer toutes les transactions avec pagination.
     
@@ -86,6 +108,8 @@ async def get_all_transactions(
         Numéro de page (indexé à partir de 1).
     limit : int
         Nombre d'éléments par page.
+    service : TransactionService
+        Service de transactions injecté par FastAPI.
     
     Retours
     -------
@@ -94,34 +118,30 @@ async def get_all_transactions(
     
     Lève
     ----
-    HTTPException
-        En cas d'erreur lors de la récupération des transactions.
+    InvalidPaginationParameters
+        Si les paramètres de pagination sont invalides ; convertie en réponse
+        400 par le gestionnaire d'exception global.
     """
-    try:
-        service = get_service()
-        return service.get_all_transactions(page=page, limit=limit)
-    except InvalidPaginationParameters as e:
-        logger.error(f"Invalid pagination parameters: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Error getting transactions: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving transactions",
-        )
+    # Building and validating up to MAX_LIMIT models is CPU work: keep it
+    # off the event loop like the other listings
+    return await asyncio.to_thread(
+        service.get_all_transactions, page=page, limit=limit
+    )
 
 
 @router.get("/{transaction_id}", response_model=Transaction)
-async def get_transaction(transaction_id: str) -> Transaction:
+async def get_transaction(
+    transaction_id: str,
+    service: TransactionService = Depends(get_service),
+) -> Transaction:
     """Récupérer une transaction par son identifiant.
     
     Paramètres
     ----------
     transaction_id : str
         L'identifiant unique de la transaction.
+    service : TransactionService
+        Service de transactions injecté par FastAPI.
     
     Retours
     -------
@@ -130,54 +150,35 @@ async def get_transaction(transaction_id: str) -> Transaction:
     
     Lève
     ----
-    HTTPException
-        Si la transaction n'existe pas ou en cas d'erreur.
+    TransactionNotFound
+        Si la transaction n'existe pas ; convertie en réponse 404 par le
+        gestionnaire d'exception global.
     """
-    try:
-        service = get_service()
-        return service.get_transaction_by_id(transaction_id)
-    except TransactionNotFound as e:
-        logger.warning(f"Transaction not found: {transaction_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Error getting transaction: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving transaction",
-        )
+    # The repository lock may be held by a worker thread: wait for it there
+    return await asyncio.to_thread(service.get_transaction_by_id, transaction_id)
 
 @router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_transaction(transaction_id: str) -> None:
+async def delete_transaction(
+    transaction_id: str,
+    service: TransactionService = Depends(get_service),
+) -> None:
     """Supprimer une transaction.
     
     Paramètres
     ----------
     transaction_id : str
         L'identifiant unique de la transaction à supprimer.
+    service : TransactionService
+        Service de transactions injecté par FastAPI.
     
     Lève
     ----
-    HTTPException
-        Si la transaction n'existe pas ou en cas d'erreur.
+    TransactionNotFound
+        Si la transaction n'existe pas ; convertie en réponse 404 par le
+        gestionnaire d'exception global.
     """
-    try:
-        service = get_service()
-        service.delete_transaction(transaction_id)
-    except TransactionNotFound as e:
-        logger.warning(f"Transaction not found for deletion: {transaction_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Error deleting transaction: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error deleting transaction",
-        )
+    # Runs under the repository lock, like the reads served from worker threads
+    await asyncio.to_thread(service.delete_transaction, transaction_id)
 
 
 @router.post(
@@ -188,6 +189,7 @@ async def search_transactions(
     filters: SearchFilters,
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=1000),
+    service: TransactionService = Depends(get_service),
 ) -> PaginatedResponse[Transaction]:
     """Rechercher des transactions avec des filtres multi-critères.
     
@@ -199,6 +201,8 @@ async def search_transactions(
         Numéro de page (indexé à partir de 1).
     limit : int
         Nombre d'éléments par page.
+    service : TransactionService
+        Service de transactions injecté par FastAPI.
     
     Retours
     -------
@@ -207,53 +211,34 @@ async def search_transactions(
     
     Lève
     ----
-    HTTPException
-        En cas d'erreur lors de la recherche.
+    InvalidPaginationParameters
+        Si les paramètres de pagination sont invalides ; convertie en réponse
+        400 par le gestionnaire d'exception global.
     """
-    try:
-        service = get_service()
-        return service.search_transactions(
-            filters=filters, page=page, limit=limit
-        )
-    except InvalidPaginationParameters as e:
-        logger.error(f"Invalid pagination parameters: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Error searching transactions: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error searching transactions",
-        )
+    return await asyncio.to_thread(
+        service.search_transactions, filters=filters, page=page, limit=limit
+    )
 
 @router.get(
     "/Type/types",
     response_model=list[dict],
 )
-async def get_transaction_types() -> list[dict]:
+async def get_transaction_types(
+    service: TransactionService = Depends(get_service),
+) -> list[dict]:
     """Récupérer tous les types de transactions avec les comptages.
     
+    Paramètres
+    ----------
+    service : TransactionService
+        Service de transactions injecté par FastAPI.
+    
     Retours
     -------
     list[dict]
         Liste des types de transactions avec leurs comptages.
-    
-    Lève
-    ----
-    HTTPException
-        En cas d'erreur lors de la récupération.
     """
-    try:
-        service = get_service()
-        return service.get_transaction_types()
-    except Exception as e:
-        logger.error(f"Error getting transaction types: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving transaction types",
-        )
+    return await asyncio.to_thread(service.get_transaction_types)
 
 @router.get(
     "/Latest/recent",
@@ -261,6 +246,7 @@ async def get_transaction_types() -> list[dict]:
 )
 async def get_recent_transactions(
     limit: int = Query(50, ge=1, le=1000),
+    service: TransactionService = Depends(get_service),
 ) -> PaginatedResponse[Transaction]:
     """Récupérer les transactions récentes.
     
@@ -268,6 +254,8 @@ async def get_recent_transactions(
     ----------
     limit : int
         Nombre maximum de transactions à retourner.
+    service : TransactionService
+        Service de transactions injecté par FastAPI.
     
     Retours
     -------
@@ -276,24 +264,11 @@ async def get_recent_transactions(
     
     Lève
     ----
-    HTTPException
-        En cas d'erreur lors de la récupération.
+    InvalidPaginationParameters
+        Si les paramètres de pagination sont invalides ; convertie en réponse
+        400 par le gestionnaire d'exception global.
     """
-    try:
-        service = get_service()
-        return service.get_recent_transactions(limit=limit)
-    except InvalidPaginationParameters as e:
-        logger.error(f"Invalid limit: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Error getting recent transactions: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving recent transactions",
-        )
+    return await asyncio.to_thread(service.get_recent_transactions, limit=limit)
 
 @router.get(
     "/by-customer/{customer_id}",
@@ -303,6 +278,7 @@ async def get_customer_transactions(
     customer_id: str,
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=1000),
+    service: TransactionService = Depends(get_service),
 ) -> PaginatedResponse[Transaction]:
     """Récupérer les transactions d'un client.
     
@@ -314,6 +290,8 @@ async def get_customer_transactions(
         Numéro de page (indexé à partir de 1).
     limit : int
         Nombre d'éléments par page.
+    service : TransactionService
+        Service de transactions injecté par FastAPI.
     
     Retours
     -------
@@ -322,26 +300,16 @@ async def get_customer_transactions(
     
     Lève
     ----
-    HTTPException
-        En cas d'erreur lors de la récupération.
+    InvalidPaginationParameters
+        Si les paramètres de pagination sont invalides ; convertie en réponse
+        400 par le gestionnaire d'exception global.
     """
-    try:
-        service = get_service()
-        return service.get_customer_transactions(
-            customer_id=customer_id, page=page, limit=limit
-        )
-    except InvalidPaginationParameters as e:
-        logger.error(f"Invalid pagination parameters: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Error getting customer transactions: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving customer transactions",
-        )
+    return await asyncio.to_thread(
+        service.get_customer_transactions,
+        customer_id=customer_id,
+        page=page,
+        limit=limit,
+    )
 
 @router.get(
     "/to-customer/{customer_id}",
@@ -351,6 +319,7 @@ async def get_merchant_transactions(
     customer_id: str,
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=1000),
+    service: TransactionService = Depends(get_service),
 ) -> PaginatedResponse[Transaction]:
     """Récupérer les transactions d'un commerçant.
     
@@ -362,6 +331,8 @@ async def get_merchant_transactions(
         Numéro de page (indexé à partir de 1).
     limit : int
         Nombre d'éléments par page.
+    service : TransactionService
+        Service de transactions injecté par FastAPI.
     
     Retours
     -------
@@ -370,23 +341,13 @@ async def get_merchant_transactions(
     
     Lève
     ----
-    HTTPException
-        En cas d'erreur lors de la récupération.
+    InvalidPaginationParameters
+        Si les paramètres de pagination sont invalides ; convertie en réponse
+        400 par le gestionnaire d'exception global.
     """
-    try:
-        service = get_service()
-        return service.get_merchant_transactions(
-            merchant_id=customer_id, page=page, limit=limit
-        )
-    except InvalidPaginationParameters as e:
-        logger.error(f"Invalid pagination parameters: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        logger.error(f"Error getting merchant transactions: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving merchant transactions",
-        )
+    return await asyncio.to_thread(
+        service.get_merchant_transactions,
+        merchant_id=customer_id,
+        page=page,
+        limit=limit,
+    )
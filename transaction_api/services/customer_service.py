@@ -10,8 +10,11 @@ CustomerService
     Service pour les opérations sur les clients.
 """
 
-from typing import List
+from typing import List, Optional
 
+import numpy as np
+
+from transaction_api.cache import VersionedCache
 from transaction_api.exceptions import InvalidPaginationParameters
 from transaction_api.logging_config import get_logger
 from transaction_api.models import (
@@ -36,8 +39,13 @@ class CustomerService:
     ---------
     repository : TransactionRepository
         Le référentiel de transactions utilisé pour accéder aux données.
+    _cache : VersionedCache
+        Résultats déjà calculés, valides tant que les données du référentiel
+        sont inchangées.
     """
 
+    __slots__ = ("repository", "_cache")
+
     def __init__(self, repository: TransactionRepository) -> None:
         """Initialiser le service.
         
@@ -47,14 +55,18 @@ class CustomerService:
             Le référentiel de transactions pour accéder aux données.
         """
         self.repository = repository
+        self._cache = VersionedCache(repository)
 
     def get_all_customers(
-        self, page: int = 1, limit: int = 50
+        self, page: int = 1, limit: int = 50, cursor: Optional[str] = None
     ) -> PaginatedResponse[CustomerSummary]:
         """Récupérer tous les clients avec pagination.
         
         Récupère une liste paginée de tous les clients avec le nombre de transactions
-        pour chaque client.
+        pour chaque client, triés par ID. Avec un curseur, la page commence
+        juste après l'ID donné, trouvé par recherche dichotomique, et ``page``
+        est ignoré. Le résultat est mis en cache jusqu'à la prochaine
+        modification des données.
         
         Paramètres
         ----------
@@ -62,6 +74,8 @@ class CustomerService:
             Numéro de page (indexé à partir de 1). Par défaut 1.
         limit : int, optionnel
             Nombre d'éléments par page. Par défaut 50.
+        cursor : str, optionnel
+            Dernier ID client de la page précédente (``next_cursor``).
         
         Retours
         -------
@@ -85,43 +99,71 @@ class CustomerService:
                 page, limit
             )
         except InvalidPaginationParameters as e:
-            logger.error(f"Invalid pagination parameters: {e}")
+            logger.error("Invalid pagination parameters: %s", e)
             raise
 
-        customer_ids = self.repository.get_all_customers()
-        total_count = len(customer_ids)
+        return self._cache.get(
+            ("all_customers", page, limit, cursor),
+            lambda: self._compute_all_customers(page, limit, cursor),
+        )
 
-        # Sort customer IDs for consistent pagination
-        customer_ids = sorted(customer_ids)
+    def _compute_all_customers(
+        self, page: int, limit: int, cursor: Optional[str]
+    ) -> PaginatedResponse[CustomerSummary]:
+        """Calculer une page de la liste des clients.
+        
+        Paramètres
+        ----------
+        page : int
+            Numéro de page validé (indexé à partir de 1).
+        limit : int
+            Nombre d'éléments par page validé.
+        cursor : str, optionnel
+            Dernier ID client de la page précédente.
+        
+        Retours
+        -------
+        PaginatedResponse[CustomerSummary]
+            Réponse paginée contenant les résumés des clients.
+        """
+        # Sorted once per data version for consistent pagination
+        customer_ids = self.repository.sorted_customer_ids
+        total_count = len(customer_ids)
 
         # Apply pagination
-        offset = (page - 1) * limit
-        paginated_ids = customer_ids[offset: offset + limit]
-
-        # Create customer summaries
-        customers = []
-        for customer_id in paginated_ids:
-            transaction_count = len(
-                self.repository.get_by_customer(
-                    customer_id, page=1, limit=1000000
-                )[0]
-            )
-            customers.append(
-                CustomerSummary(
-                    customer_id=customer_id,
-                    transaction_count=transaction_count,
-                )
+        if cursor is not None:
+            offset = int(np.searchsorted(customer_ids, cursor, side="right"))
+            page = offset // limit + 1
+        else:
+            offset = (page - 1) * limit
+        paginated_ids = customer_ids[offset: offset + limit].tolist()
+        next_cursor = (
+            paginated_ids[-1]
+            if paginated_ids and offset + limit < total_count
+            else None
+        )
+
+        # Create customer summaries from one batched count lookup; the values
+        # are already typed by the repository, so validation is skipped
+        counts = self.repository.get_counts_by_customers(paginated_ids)
+        customers = [
+            CustomerSummary.model_construct(
+                customer_id=customer_id, transaction_count=counts[customer_id]
             )
+            for customer_id in paginated_ids
+        ]
 
         return PaginationService.create_paginated_response(
-            customers, page, limit, total_count
+            customers, page, limit, total_count, next_cursor
         )
 
     def get_customer_details(self, customer_id: str) -> Customer:
         """Récupérer les détails d'un client spécifique.
         
         Récupère les informations détaillées d'un client, y compris le nombre total
-        de transactions, le montant total et le montant moyen.
+        de transactions, le montant total et le montant moyen. Les agrégats sont
+        lus dans les totaux par client du référentiel, sans charger les
+        transactions.
         
         Paramètres
         ----------
@@ -140,27 +182,25 @@ class CustomerService:
         >>> customer.transaction_count
         42
         """
-        transactions, total_count = self.repository.get_by_customer(
-            customer_id, page=1, limit=1000000
-        )
+        # One snapshot: a delete from another thread can land between the reads
+        with self.repository.lock:
+            transaction_count = self.repository.count_by_customer(customer_id)
+            total_amount = self.repository.sum_amount_by_customer(customer_id)
 
-        if not transactions:
+        if transaction_count == 0:
             # Return empty customer
-            return Customer(
+            return Customer.model_construct(
                 customer_id=customer_id,
                 transaction_count=0,
                 total_amount=0.0,
                 average_amount=0.0,
             )
 
-        total_amount = sum(t.amount for t in transactions)
-        average_amount = (
-            total_amount / len(transactions) if transactions else 0.0
-        )
+        average_amount = total_amount / transaction_count
 
-        return Customer(
+        return Customer.model_construct(
             customer_id=customer_id,
-            transaction_count=len(transactions),
+            transaction_count=transaction_count,
             total_amount=total_amount,
             average_amount=average_amount,
         )
@@ -169,7 +209,8 @@ class CustomerService:
         """Récupérer les n meilleurs clients par nombre de transactions.
         
         Identifie et retourne les clients les plus actifs en fonction du nombre
-        de transactions qu'ils ont effectuées.
+        de transactions qu'ils ont effectuées. Le résultat est mis en cache
+        jusqu'à la prochaine modification des données.
         
         Paramètres
         ----------
@@ -190,29 +231,32 @@ class CustomerService:
         >>> top_customers[0].transaction_count >= top_customers[1].transaction_count
         True
         """
-        customer_ids = self.repository.get_all_customers()
-
-        # Get customer details for all customers
-        top_customers_list: List[TopCustomer] = []
-        for customer_id in customer_ids:
-            transactions, _ = self.repository.get_by_customer(
-                customer_id, page=1, limit=1000000
+        return list(
+            self._cache.get(
+                ("top_customers", n), lambda: self._compute_top_customers(n)
             )
-            if transactions:
-                total_amount = sum(t.amount for t in transactions)
-                top_customers_list.append(
-                    TopCustomer(
-                        customer_id=customer_id,
-                        transaction_count=len(transactions),
-                        total_amount=total_amount,
-                    )
-                )
-
-        # Sort by transaction count descending
-        top_customers_list.sort(
-            key=lambda c: c.transaction_count,
-            reverse=True,
         )
 
-        # Get only top n customers
-        return top_customers_list[:n]
+    def _compute_top_customers(self, n: int) -> List[TopCustomer]:
+        """Calculer les n meilleurs clients par nombre de transactions.
+        
+        Paramètres
+        ----------
+        n : int
+            Nombre de clients à retourner.
+        
+        Retours
+        -------
+        List[TopCustomer]
+            Liste des n meilleurs clients triés par nombre de transactions décroissant.
+        """
+        # Trusted, already typed repository values: skip validation
+        return [
+            TopCustomer.model_construct(
+                customer_id=customer_id,
+                transaction_count=transaction_count,
+                total_amount=total_amount,
+            )
+            for customer_id, transaction_count, total_amount
+            in self.repository.get_top_customers(n)
+        ]
@@ -11,6 +11,8 @@ FraudService
 
 from typing import List
 
+import numpy as np
+
 from transaction_api.logging_config import get_logger
 from transaction_api.models import (
     FraudPrediction,
@@ -22,6 +24,19 @@ from transaction_api.repository import TransactionRepository
 
 logger = get_logger(__name__)
 
+# Fraud score weights, shared by the single and batch predictions
+ERROR_WEIGHT = 0.8
+HIGH_AMOUNT = 5000
+HIGH_AMOUNT_WEIGHT = 0.2
+MODERATE_AMOUNT = 2000
+MODERATE_AMOUNT_WEIGHT = 0.1
+NO_CHIP_WEIGHT = 0.1
+
+# Summary of a repository without transactions
+_EMPTY_SUMMARY = FraudSummary(
+    total_fraud_count=0, fraud_rate=0.0, total_fraud_amount=0.0
+)
+
 
 class FraudService:
     """Service pour les opérations de détection de fraude.
@@ -35,6 +50,8 @@ class FraudService:
         Le référentiel de transactions utilisé pour accéder aux données.
     """
 
+    __slots__ = ("repository",)
+
     def __init__(self, repository: TransactionRepository) -> None:
         """Initialiser le service.
         
@@ -63,16 +80,15 @@ class FraudService:
         >>> summary.fraud_rate
         0.05
         """
-        transactions = self.repository.get_all_transactions()
-        fraud_transactions = self.repository.get_fraud_transactions()
-
-        total_count = len(transactions)
-        fraud_count = len(fraud_transactions)
-        if total_count > 0:
-            fraud_rate = fraud_count / total_count
-        else:
-            fraud_rate = 0.0
-        total_fraud_amount = sum(t.amount for t in fraud_transactions)
+        # Counts and amount are maintained by the repository: O(1)
+        # One snapshot: a delete from another thread can land between the reads
+        with self.repository.lock:
+            total_count = self.repository.count()
+            fraud_count = len(self.repository.fraud_index)
+            total_fraud_amount = self.repository.fraud_amount
+        if total_count == 0:
+            return _EMPTY_SUMMARY
+        fraud_rate = fraud_count / total_count
 
         return FraudSummary(
             total_fraud_count=fraud_count,
@@ -98,29 +114,21 @@ class FraudService:
         >>> stats[0].fraud_rate >= stats[1].fraud_rate
         True
         """
-        use_chip_types = self.repository.get_all_use_chip_types()
-        fraud_stats = []
-
-        for use_chip in use_chip_types:
-            transactions = self.repository.get_all_by_use_chip(use_chip)
-            fraud_transactions = [t for t in transactions if t.errors]
-
-            if transactions:
-                fraud_count = len(fraud_transactions)
-                total_count = len(transactions)
-                if total_count > 0:
-                    fraud_rate = fraud_count / total_count
-                else:
-                    fraud_rate = 0.0
-
-                fraud_stats.append(
-                    FraudTypeStats(
-                        type=use_chip,
-                        fraud_count=fraud_count,
-                        fraud_rate=fraud_rate,
-                        total_count=total_count,
-                    )
-                )
+        # One pass over the maintained indexes instead of a scan per type
+        # One snapshot: a delete from another thread can land between the reads
+        with self.repository.lock:
+            fraud_counts = self.repository.get_fraud_counts_by_use_chip()
+            type_counts = self.repository.get_use_chip_counts()
+        fraud_stats = [
+            FraudTypeStats(
+                type=use_chip,
+                fraud_count=fraud_counts.get(use_chip, 0),
+                fraud_rate=fraud_counts.get(use_chip, 0) / total_count,
+                total_count=total_count,
+            )
+            for use_chip, total_count in type_counts.items()
+            if total_count > 0
+        ]
 
         # Sort by fraud rate descending
         fraud_stats.sort(key=lambda x: x.fraud_rate, reverse=True)
@@ -154,6 +162,77 @@ class FraudService:
 
         return FraudPrediction(fraud_score=score, reasoning=reasoning)
 
+    def predict_fraud_batch(
+        self, transactions: List[Transaction]
+    ) -> List[FraudPrediction]:
+        """Prédire le risque de fraude pour plusieurs transactions.
+        
+        Les indicateurs de toutes les transactions sont rassemblés dans des
+        tableaux numpy et les scores calculés en une seule passe vectorisée,
+        avec les mêmes pondérations que ``predict_fraud``.
+        
+        Paramètres
+        ----------
+        transactions : List[Transaction]
+            Les transactions à analyser.
+        
+        Retours
+        -------
+        List[FraudPrediction]
+            Une prédiction par transaction, dans le même ordre.
+        
+        Exemples
+        --------
+        >>> service = FraudService(repository)
+        >>> predictions = service.predict_fraud_batch([transaction])
+        >>> predictions[0] == service.predict_fraud(transaction)
+        True
+        """
+        scores = self._calculate_fraud_scores(transactions)
+        return [
+            FraudPrediction(
+                fraud_score=score,
+                reasoning=self._generate_reasoning(transaction, score),
+            )
+            for transaction, score in zip(transactions, scores.tolist())
+        ]
+
+    def _calculate_fraud_scores(
+        self, transactions: List[Transaction]
+    ) -> np.ndarray:
+        """Calculer les scores de fraude de plusieurs transactions.
+        
+        Paramètres
+        ----------
+        transactions : List[Transaction]
+            Les transactions à analyser.
+        
+        Retours
+        -------
+        np.ndarray
+            Scores de fraude entre 0.0 et 1.0, un par transaction.
+        """
+        count = len(transactions)
+        has_errors = np.fromiter(
+            (bool(t.errors) for t in transactions), dtype=bool, count=count
+        )
+        amounts = np.fromiter(
+            (t.amount for t in transactions), dtype=np.float64, count=count
+        )
+        no_chip = np.fromiter(
+            (not t.use_chip for t in transactions), dtype=bool, count=count
+        )
+
+        # Same additions, in the same order, as the single prediction
+        scores = np.where(has_errors, ERROR_WEIGHT, 0.0)
+        scores += np.select(
+            [amounts > HIGH_AMOUNT, amounts > MODERATE_AMOUNT],
+            [HIGH_AMOUNT_WEIGHT, MODERATE_AMOUNT_WEIGHT],
+            0.0,
+        )
+        scores += np.where(no_chip, NO_CHIP_WEIGHT, 0.0)
+        return np.clip(scores, 0.0, 1.0)
+
     def _calculate_fraud_score(self, transaction: Transaction) -> float:
         """Calculer le score de fraude pour une transaction.
         
@@ -174,17 +253,17 @@ class FraudService:
 
         # Check if transaction has errors field
         if transaction.errors:
-            score += 0.8
+            score += ERROR_WEIGHT
 
         # Check amount - very high amounts are suspicious
-        if transaction.amount > 5000:
-            score += 0.2
-        elif transaction.amount > 2000:
-            score += 0.1
+        if transaction.amount > HIGH_AMOUNT:
+            score += HIGH_AMOUNT_WEIGHT
+        elif transaction.amount > MODERATE_AMOUNT:
+            score += MODERATE_AMOUNT_WEIGHT
 
         # Check if chip was not used - higher fraud risk
         if not transaction.use_chip:
-            score += 0.1
+            score += NO_CHIP_WEIGHT
 
         # Ensure score is between 0 and 1
         return min(1.0, max(0.0, score))
@@ -214,9 +293,9 @@ class FraudService:
         if transaction.errors:
             reasons.append(f"Has error flag: {transaction.errors}")
 
-        if transaction.amount > 5000:
+        if transaction.amount > HIGH_AMOUNT:
             reasons.append(f"High amount: ${transaction.amount:.2f}")
-        elif transaction.amount > 2000:
+        elif transaction.amount > MODERATE_AMOUNT:
             reasons.append(f"Moderate amount: ${transaction.amount:.2f}")
 
         if not transaction.use_chip:
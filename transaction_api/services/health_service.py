@@ -10,7 +10,6 @@ HealthService
 """
 
 import time
-from datetime import datetime
 
 from transaction_api.config import API_VERSION
 from transaction_api.logging_config import get_logger
@@ -32,6 +31,8 @@ class HealthService:
         Le référentiel de transactions utilisé pour accéder aux données.
     """
 
+    __slots__ = ("repository",)
+
     def __init__(self, repository: TransactionRepository) -> None:
         """Initialiser le service.
         
@@ -63,16 +64,16 @@ class HealthService:
         start_time = time.time()
 
         try:
-            # Simple health check - verify repository is accessible
-            _ = self.repository.get_all_transactions()
+            # Constant-time check: probes must not scan the dataset
+            healthy = self.repository.ping()
 
             response_time_ms = (time.time() - start_time) * 1000
             return HealthStatus(
-                status="healthy",
+                status="healthy" if healthy else "unhealthy",
                 response_time_ms=response_time_ms,
             )
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
+            logger.error("Health check failed: %s", e)
             response_time_ms = (time.time() - start_time) * 1000
             return HealthStatus(
                 status="unhealthy",
@@ -97,18 +98,19 @@ class HealthService:
         >>> metadata.api_version
         '1.0.0'
         """
-        transactions = self.repository.get_all_transactions()
-        total_count = len(transactions)
+        # One snapshot: a delete from another thread can land between the reads
+        with self.repository.lock:
+            total_count = self.repository.count()
+            # Bounds are kept by the repository until the next change
+            min_date = self.repository.min_date
+            max_date = self.repository.max_date
 
-        if transactions:
-            min_date = min(t.date for t in transactions)
-            max_date = max(t.date for t in transactions)
-        else:
-            now = datetime.utcnow()
-            min_date = now
-            max_date = now
+        if not total_count:
+            # Deterministic fallback, no clock read on the request path
+            min_date = self.repository.data_load_date
+            max_date = self.repository.data_load_date
 
-        data_load_date = self.repository.data_load_date or datetime.utcnow()
+        data_load_date = self.repository.data_load_date
 
         return SystemMetadata(
             total_transaction_count=total_count,
@@ -116,4 +118,4 @@ class HealthService:
             api_version=API_VERSION,
             min_date=min_date,
             max_date=max_date,
-        )
\ No newline at end of file
+        )
@@ -9,9 +9,9 @@ StatisticsService
     Service pour les opérations de statistiques.
 """
 
-from collections import defaultdict
-from datetime import datetime
-from typing import List
+from typing import Iterator, List
+
+import numpy as np
 
 from transaction_api.config import AMOUNT_BUCKETS
 from transaction_api.logging_config import get_logger
@@ -25,6 +25,18 @@ from transaction_api.repository import TransactionRepository
 
 logger = get_logger(__name__)
 
+# Bounds of AMOUNT_BUCKETS, sorted by lower bound, for np.searchsorted
+_BUCKET_MINS = np.array([bucket["min"] for bucket in AMOUNT_BUCKETS], dtype=np.float64)
+_BUCKET_MAXS = np.array([bucket["max"] for bucket in AMOUNT_BUCKETS], dtype=np.float64)
+
+# Distribution of a repository without transactions
+_EMPTY_DISTRIBUTION = AmountDistribution(
+    buckets=[
+        AmountBucket(range=bucket["label"], count=0, percentage=0.0)
+        for bucket in AMOUNT_BUCKETS
+    ]
+)
+
 
 class StatisticsService:
     """Service pour les opérations de statistiques.
@@ -39,6 +51,8 @@ class StatisticsService:
         Le référentiel de transactions utilisé pour accéder aux données.
     """
 
+    __slots__ = ("repository",)
+
     def __init__(self, repository: TransactionRepository) -> None:
         """Initialiser le service.
         
@@ -48,7 +62,7 @@ class StatisticsService:
             Le référentiel de transactions pour accéder aux données.
         """
         self.repository = repository
-    
+
     def get_overview_stats(self) -> OverviewStats:
         """Récupérer les statistiques générales.
         
@@ -67,23 +81,27 @@ class StatisticsService:
         >>> stats.total_count
         1000
         """
-        transactions = self.repository.get_all_transactions()
+        # One snapshot: a delete from another thread can land between the reads
+        with self.repository.lock:
+            total_count = self.repository.count()
+            # Running total maintained by the repository: O(1)
+            total_amount = self.repository.total_amount
+            # Bounds are kept by the repository until the next change
+            min_date = self.repository.min_date
+            max_date = self.repository.max_date
 
-        if not transactions:
-            now = datetime.utcnow()
+        if total_count == 0:
+            # Deterministic fallback, no clock read on the request path
+            loaded_at = self.repository.data_load_date
             return OverviewStats(
                 total_count=0,
                 total_amount=0.0,
                 average_amount=0.0,
-                min_date=now,
-                max_date=now,
+                min_date=loaded_at,
+                max_date=loaded_at,
             )
 
-        total_count = len(transactions)
-        total_amount = sum(t.amount for t in transactions)
-        average_amount = total_amount / total_count if total_count > 0 else 0.0
-        min_date = min(t.date for t in transactions)
-        max_date = max(t.date for t in transactions)
+        average_amount = total_amount / total_count
 
         return OverviewStats(
             total_count=total_count,
@@ -92,7 +110,7 @@ class StatisticsService:
             min_date=min_date,
             max_date=max_date,
         )
-    
+
     def get_amount_distribution(self) -> AmountDistribution:
         """Récupérer les statistiques de distribution des montants.
         
@@ -111,37 +129,31 @@ class StatisticsService:
         >>> distribution.buckets[0].range
         '0-100'
         """
-        transactions = self.repository.get_all_transactions()
-        total_count = len(transactions)
-
-        if total_count == 0:
-            buckets = [
-                AmountBucket(range=b["label"], count=0, percentage=0.0)
-                for b in AMOUNT_BUCKETS
-            ]
-            return AmountDistribution(buckets=buckets)
-
-        # Count transactions in each bucket
-        bucket_counts: dict = defaultdict(int)
-        for transaction in transactions:
-            for bucket in AMOUNT_BUCKETS:
-                if bucket["min"] <= transaction.amount < bucket["max"]:
-                    bucket_counts[bucket["label"]] += 1
-                    break
+        # The view follows in-place deletes: read it under the repository lock
+        with self.repository.lock:
+            amounts = self.repository.amounts_view()
+            total_count = amounts.size
+            if total_count == 0:
+                return _EMPTY_DISTRIBUTION
+
+            # Locate each amount's bucket by binary search on the lower bounds,
+            # then drop amounts below the first bound or past their bucket's
+            # upper bound (NaN fails both checks, like the range comparison).
+            positions = np.searchsorted(_BUCKET_MINS, amounts, side="right") - 1
+            inside = positions >= 0
+            inside[inside] = amounts[inside] < _BUCKET_MAXS[positions[inside]]
+        bucket_counts = np.bincount(
+            positions[inside], minlength=len(AMOUNT_BUCKETS)
+        ).tolist()
 
         # Create bucket responses
         buckets = []
-        for bucket in AMOUNT_BUCKETS:
-            count = bucket_counts[bucket["label"]]
-            if total_count > 0:
-                percentage = count / total_count * 100
-            else:
-                percentage = 0.0
+        for bucket, count in zip(AMOUNT_BUCKETS, bucket_counts):
             buckets.append(
                 AmountBucket(
                     range=bucket["label"],
                     count=count,
-                    percentage=percentage,
+                    percentage=count / total_count * 100,
                 )
             )
 
@@ -165,29 +177,17 @@ class StatisticsService:
         >>> stats[0].count >= stats[1].count
         True
         """
-        types = self.repository.get_all_types()
-        type_stats = []
-
-        for mcc in types:
-            transactions = self.repository.get_all_by_type(mcc)
-            if transactions:
-                count = len(transactions)
-                total_amount = sum(t.amount for t in transactions)
-                average_amount = total_amount / count if count > 0 else 0.0
-
-                type_stats.append(
-                    TypeStats(
-                        type=mcc,
-                        count=count,
-                        total_amount=total_amount,
-                        average_amount=average_amount,
-                    )
-                )
+        # Grouped and sorted by count descending in the repository
+        return [
+            TypeStats(
+                type=mcc,
+                count=count,
+                total_amount=total_amount,
+                average_amount=total_amount / count,
+            )
+            for mcc, count, total_amount in self.repository.get_totals_by_type()
+        ]
 
-        # Sort by count descending
-        type_stats.sort(key=lambda x: x.count, reverse=True)
-        return type_stats
-    
     def get_daily_stats(self) -> list[dict]:
         """Récupérer les statistiques quotidiennes groupées par date.
         
@@ -206,29 +206,25 @@ class StatisticsService:
         >>> daily[0]["date"]
         '2023-01-01'
         """
-        transactions = self.repository.get_all_transactions()
-
-        # Group by date
-        daily_data = defaultdict(list)
-        for transaction in transactions:
-            day = transaction.date.date()
-            daily_data[day].append(transaction)
-
-        # Create daily stats
-        daily_stats = []
-        for day in sorted(daily_data.keys()):
-            transactions_on_day = daily_data[day]
-            count = len(transactions_on_day)
-            total_amount = sum(t.amount for t in transactions_on_day)
-            average_amount = total_amount / count if count > 0 else 0.0
-
-            daily_stats.append(
-                {
-                    "date": str(day),
-                    "count": count,
-                    "total_amount": total_amount,
-                    "average_amount": average_amount,
-                }
-            )
+        return list(self.iter_daily_stats())
 
-        return daily_stats
+    def iter_daily_stats(self) -> Iterator[dict]:
+        """Itérer sur les statistiques quotidiennes par date croissante.
+        
+        Produit les mêmes lignes que ``get_daily_stats`` une à une, afin
+        qu'une réponse en flux puisse les encoder sans construire une seconde
+        liste.
+        
+        Retours
+        -------
+        Iterator[dict]
+            Statistiques de chaque jour, triées par date croissante.
+        """
+        # Days are grouped on the int64 timestamp column by the repository
+        for day, count, total_amount in self.repository.get_daily_totals():
+            yield {
+                "date": day,
+                "count": count,
+                "total_amount": total_amount,
+                "average_amount": total_amount / count,
+            }
@@ -11,6 +11,7 @@ TransactionService
 
 from typing import List
 
+from transaction_api.cache import VersionedCache
 from transaction_api.exceptions import (
     InvalidPaginationParameters,
     TransactionNotFound,
@@ -37,8 +38,13 @@ class TransactionService:
     ---------
     repository : TransactionRepository
         Le référentiel de transactions utilisé pour accéder aux données.
+    _cache : VersionedCache
+        Résultats déjà calculés, valides tant que les données du référentiel
+        sont inchangées.
     """
 
+    __slots__ = ("repository", "_cache")
+
     def __init__(self, repository: TransactionRepository) -> None:
         """Initialiser le service.
         
@@ -48,6 +54,7 @@ class TransactionService:
             Le référentiel de transactions pour accéder aux données.
         """
         self.repository = repository
+        self._cache = VersionedCache(repository)
 
     def get_all_transactions(
         self, page: int = 1, limit: int = 50
@@ -79,7 +86,7 @@ class TransactionService:
                 page, limit
             )
         except InvalidPaginationParameters as e:
-            logger.error(f"Invalid pagination parameters: {e}")
+            logger.error("Invalid pagination parameters: %s", e)
             raise
 
         transactions, total_count = self.repository.get_all(
@@ -118,7 +125,7 @@ class TransactionService:
         """
         transaction = self.repository.get_by_id(transaction_id)
         if transaction is None:
-            logger.warning(f"Transaction not found: {transaction_id}")
+            logger.warning("Transaction not found: %s", transaction_id)
             msg = f"Transaction with ID {transaction_id} not found"
             raise TransactionNotFound(msg)
         return transaction
@@ -155,7 +162,7 @@ class TransactionService:
                 page, limit
             )
         except InvalidPaginationParameters as e:
-            logger.error(f"Invalid pagination parameters: {e}")
+            logger.error("Invalid pagination parameters: %s", e)
             raise
         transactions, total_count = self.repository.search(
             filters=filters, page=page, limit=limit
@@ -179,8 +186,7 @@ class TransactionService:
         TransactionNotFound
             Si la transaction n'existe pas.
         """
-        transaction = self.repository.get_by_id(transaction_id)
-        if transaction is None:
+        if not self.repository.delete(transaction_id):
             logger.warning(
                 "Transaction not found for deletion: %s",
                 transaction_id,
@@ -188,14 +194,14 @@ class TransactionService:
             msg = f"Transaction with ID {transaction_id} not found"
             raise TransactionNotFound(msg)
 
-        self.repository.delete(transaction_id)
-        logger.info(f"Deleted transaction: {transaction_id}")
+        logger.info("Deleted transaction: %s", transaction_id)
 
     def get_transaction_types(self) -> List[dict]:
         """Récupérer tous les types de transactions avec les comptages.
         
         Récupère tous les types de transactions (use_chip) uniques avec le nombre
-        de transactions pour chaque type.
+        de transactions pour chaque type. Le résultat est mis en cache jusqu'à
+        la prochaine modification des données.
         
         Retours
         -------
@@ -209,22 +215,31 @@ class TransactionService:
         >>> types[0]["type"]
         'Swipe Transaction'
         """
-        use_chip_types = self.repository.get_all_use_chip_types()
-        type_stats: List[dict] = []
-        
-        for use_chip in use_chip_types:
-            transactions = self.repository.get_all_by_use_chip(use_chip)
-            type_stats.append(
-                {
-                    "type": use_chip,
-                    "count": len(transactions),
-                }
+        return [
+            dict(type_stat)
+            for type_stat in self._cache.get(
+                "transaction_types", self._compute_transaction_types
             )
+        ]
+
+    def _compute_transaction_types(self) -> List[dict]:
+        """Calculer les types de transactions avec les comptages.
+        
+        Retours
+        -------
+        List[dict]
+            Liste de dictionnaires contenant le type et le nombre de
+            transactions, triée par nombre décroissant.
+        """
+        type_stats: List[dict] = [
+            {"type": use_chip, "count": count}
+            for use_chip, count in self.repository.get_use_chip_counts().items()
+        ]
 
         # Sort by count descending
         type_stats.sort(key=lambda x: x["count"], reverse=True)  # type: ignore
         return type_stats
-    
+
     def get_recent_transactions(
         self, limit: int = 50
     ) -> PaginatedResponse[Transaction]:
@@ -250,7 +265,7 @@ class TransactionService:
         try:
             _, limit = PaginationService.validate_pagination_params(1, limit)
         except InvalidPaginationParameters as e:
-            logger.error(f"Invalid limit: {e}")
+            logger.error("Invalid limit: %s", e)
             raise
 
         transactions, total_count = self.repository.get_all(
@@ -291,7 +306,7 @@ class TransactionService:
                 page, limit
             )
         except InvalidPaginationParameters as e:
-            logger.error(f"Invalid pagination parameters: {e}")
+            logger.error("Invalid pagination parameters: %s", e)
             raise
 
         transactions, total_count = self.repository.get_by_customer(
@@ -332,7 +347,7 @@ class TransactionService:
                 page, limit
             )
         except InvalidPaginationParameters as e:
-            logger.error(f"Invalid pagination parameters: {e}")
+            logger.error("Invalid pagination parameters: %s", e)
             raise
 
         transactions, total_count = self.repository.get_by_merchant(